@@ -3,20 +3,27 @@ import asyncio
 import logging
 import json
 import httpx
-import time
 import secrets
 from datetime import datetime, timedelta
 from typing import List, Optional
 from urllib.parse import urlparse
+from email.utils import formatdate, parsedate_to_datetime
 
 from fastapi import FastAPI, Request, Depends, Header, Query, Body, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.responses import FileResponse, JSONResponse, RedirectResponse, Response
+from starlette.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, func, tuple_, select
+from sqlalchemy.exc import OperationalError
 
 from auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -26,22 +33,63 @@ from auth import (
     get_db,
     decode_token,
 )
-from models import User, HotDeal, Comment, TelegramUser, Bookmark, PriceHistory
+from models import (
+    User,
+    HotDeal,
+    Comment,
+    TelegramUser,
+    Bookmark,
+    PriceHistory,
+    FTS_ENABLED,
+    fts_match_subquery,
+)
 from core.helpers import (
     parse_price_to_number,
     clean_deal_title,
     is_allowed_image_url,
     is_valid_admin_secret,
+    make_like_pattern,
+    make_etag,
+    etag_matches,
+    FTS_MIN_QUERY_LENGTH,
     KST,
 )
 from services.database import (
     crawl_and_save_to_db,
     backup_database,
-    cleanup_old_deals,
-    _hotdeals_cache,
-    CACHE_TTL,
+    run_cleanup_old_deals,
+    response_cache,
+    count_cache,
+    data_generations,
+)
+from services.rag import (
+    init_vectorstore,
+    close_vectorstore,
+    vectorstore_health,
+    purge_orphan_vectors,
+)
+from services.http_client import http_clients
+from services.rag_sync import start_rag_sync, rag_sync_status
+from services.ai_search import (
+    run_ai_search,
+    stream_ai_search,
+    answer_cache,
+    keyword_cache,
+)
+from services.deal_counters import (
+    load_deal_summary,
+    rebuild_deal_counters,
+    refresh_deal_counters,
 )
-from services.rag import get_vectorstore, upsert_rag_documents
+from core.serialization import deal_list_body, dumps
+from services.db_executor import run_db, shutdown_db_executor
+from services.parse_executor import (
+    start_parse_executor,
+    shutdown_parse_executor,
+    parse_executor_stats,
+)
+from services.loop_monitor import loop_lag
+from services.crawl_changes import known_links, source_changes
 
 try:
     from dotenv import load_dotenv
@@ -57,10 +105,6 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 import google.generativeai as genai
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
-from langchain_core.output_parsers import StrOutputParser
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 IS_PRODUCTION = os.getenv("APP_ENV") == "production"
@@ -140,9 +184,19 @@ def require_admin_access(
 scheduler = AsyncIOScheduler()
 
 
+async def run_purge_orphan_vectors():
+    """스케줄러용: AI 검색 중 발견된 orphan 벡터 삭제"""
+    await asyncio.to_thread(purge_orphan_vectors)
+
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("🚀 서버 시작: 백그라운드 스케줄러 활성화")
+    http_clients.open()
+    start_parse_executor()
+    loop_lag.start()
+    await run_db(rebuild_deal_counters)
+    await asyncio.to_thread(init_vectorstore)
 
     scheduler.add_job(
         crawl_and_save_to_db,
@@ -161,7 +215,15 @@ async def startup_event():
     )
 
     scheduler.add_job(
-        cleanup_old_deals, "cron", hour=4, minute=0, id="cleanup_job", timezone=KST
+        run_cleanup_old_deals, "cron", hour=4, minute=0, id="cleanup_job", timezone=KST
+    )
+
+    scheduler.add_job(
+        run_purge_orphan_vectors,
+        "interval",
+        minutes=10,
+        id="orphan_vector_job",
+        timezone=KST,
     )
 
     scheduler.start()
@@ -174,10 +236,178 @@ async def startup_event():
 async def shutdown_event():
     logger.info("🛑 서버 종료: 스케줄러 정지")
     scheduler.shutdown()
+    await loop_lag.stop()
+    await http_clients.aclose()
+    await asyncio.to_thread(close_vectorstore)
+    await asyncio.to_thread(shutdown_parse_executor)
+    shutdown_db_executor()
+
+
+API_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+API_MICROCACHE_SECONDS = int(os.getenv("API_MICROCACHE_SECONDS", 5))
+
+
+def conditional_headers(request: Request, generation: str) -> dict:
+    """데이터 세대 기반 ETag/Last-Modified/Cache-Control 헤더"""
+    etag = make_etag(
+        data_generations.epoch, generation, request.url.path, request.url.query
+    )
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(int(data_generations.changed_at), usegmt=True),
+        "Cache-Control": API_CACHE_CONTROL,
+        # nginx 마이크로 캐시 유효기간 (클라이언트로는 전달되지 않음)
+        "X-Accel-Expires": str(API_MICROCACHE_SECONDS),
+    }
+
+
+def is_not_modified(request: Request, headers: dict) -> bool:
+    """If-None-Match / If-Modified-Since 기준으로 클라이언트 사본이 최신인지"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, headers["ETag"])
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return (
+                int(data_generations.changed_at)
+                <= parsedate_to_datetime(if_modified_since).timestamp()
+            )
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def json_bytes_response(body: bytes, headers: dict) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+PRICE_RANGE_FILTERS = {
+    "0-5만": (0, 50000),
+    "5-10만": (50000, 100000),
+    "10-20만": (100000, 200000),
+    "20만+": (200000, None),
+}
+
+
+def apply_deal_filters(
+    query,
+    source: str = "all",
+    category: str = "all",
+    shipping_free: bool = False,
+    price_range: str = "all",
+):
+    """핫딜 목록/검색 공통 필터"""
+    if source != "all":
+        query = query.filter(HotDeal.source == source)
+
+    if category != "all":
+        query = query.filter(HotDeal.category == category)
+
+    if shipping_free:
+        query = query.filter(HotDeal.shipping.like("%무료%"))
+
+    if price_range in PRICE_RANGE_FILTERS:
+        low, high = PRICE_RANGE_FILTERS[price_range]
+        query = query.filter(HotDeal.price_value > low)
+        if high is not None:
+            query = query.filter(HotDeal.price_value <= high)
+
+    return query
+
+
+def encode_deal_cursor(deal: HotDeal) -> str:
+    return f"{deal.created_at.isoformat()},{deal.id}"
+
+
+def decode_deal_cursor(cursor: str):
+    try:
+        created_at, deal_id = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(created_at), int(deal_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다")
+
+
+def order_deals(query, sort: str):
+    """created_at + id 순 정렬 (ix_hotdeals_created / ix_hotdeals_source_created 사용)"""
+    if sort == "oldest":
+        return query.order_by(HotDeal.created_at.asc(), HotDeal.id.asc())
+    return query.order_by(HotDeal.created_at.desc(), HotDeal.id.desc())
+
+
+def cached_deal_count(cache_key: str, query) -> int:
+    """필터별 COUNT 결과 캐시"""
+    total = count_cache.get(cache_key)
+    if total is None:
+        total = query.with_entities(func.count(HotDeal.id)).scalar() or 0
+        count_cache.set(cache_key, total)
+    return total
+
+
+def paginate_deals(query, sort: str, per_page: int, page: int, cursor, count_key: str):
+    """cursor가 있으면 keyset, 없으면 LIMIT/OFFSET + 캐시된 COUNT"""
+    if cursor:
+        created_at, deal_id = decode_deal_cursor(cursor)
+        key = tuple_(HotDeal.created_at, HotDeal.id)
+        if sort == "oldest":
+            query = query.filter(key > tuple_(created_at, deal_id))
+        else:
+            query = query.filter(key < tuple_(created_at, deal_id))
+
+        rows = order_deals(query, sort).limit(per_page + 1).all()
+        has_more = len(rows) > per_page
+        deals = rows[:per_page]
+        pagination = {
+            "per_page": per_page,
+            "cursor": cursor,
+            "next_cursor": encode_deal_cursor(deals[-1]) if has_more else None,
+            "has_more": has_more,
+        }
+        return deals, pagination
+
+    total = cached_deal_count(count_key, query)
+    total_pages = max(1, (total + per_page - 1) // per_page)
+    deals = order_deals(query, sort).offset((page - 1) * per_page).limit(per_page).all()
+    has_more = page * per_page < total
+    pagination = {
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "total_pages": total_pages,
+        "next_cursor": encode_deal_cursor(deals[-1]) if has_more and deals else None,
+        "has_more": has_more,
+    }
+    return deals, pagination
+
+
+def load_hotdeals_page(
+    db: Session,
+    source: str,
+    category: str,
+    shipping_free: bool,
+    price_range: str,
+    sort: str,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+    count_key: str,
+) -> bytes:
+    query = apply_deal_filters(
+        db.query(HotDeal), source, category, shipping_free, price_range
+    )
+    paginated_deals, pagination = paginate_deals(
+        query, sort, per_page, page, cursor, count_key=count_key
+    )
+    logger.info(
+        f"API 요청: source={source}, page={page}/{pagination.get('total_pages', '-')}, cursor={cursor}, price_range={price_range}, shipping_free={shipping_free}, sort={sort} - {len(paginated_deals)}개 반환"
+    )
+    return deal_list_body(paginated_deals, pagination=pagination)
 
 
 @app.get("/api/hotdeals")
 async def hotdeals(
+    request: Request,
     source: str = "all",
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
@@ -187,170 +417,184 @@ async def hotdeals(
     category: str = "all",
     shipping_free: bool = False,
     sort: str = Query(default="latest", regex="^(latest|oldest)$"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
-    cache_key = (
-        f"{source}:{page}:{per_page}:{price_range}:{category}:{shipping_free}:{sort}"
+    generation = data_generations.token(source, category)
+    headers = conditional_headers(request, generation)
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    filter_key = f"{source}:{price_range}:{category}:{shipping_free}@{generation}"
+    cache_key = f"hotdeals:{filter_key}:{page}:{per_page}:{sort}:{cursor or ''}"
+
+    body = await response_cache.get_or_load(
+        cache_key,
+        lambda: run_db(
+            load_hotdeals_page,
+            source,
+            category,
+            shipping_free,
+            price_range,
+            sort,
+            page,
+            per_page,
+            cursor,
+            count_key=f"hotdeals:{filter_key}",
+        ),
     )
-    now = time.time()
-    if cache_key in _hotdeals_cache:
-        ts, cached = _hotdeals_cache[cache_key]
-        if now - ts < CACHE_TTL:
-            return cached
+    return json_bytes_response(body, headers)
 
-    query = db.query(HotDeal)
 
-    if source != "all":
-        query = query.filter(HotDeal.source == source)
+STATS_SOURCE_KEYS = {
+    "뽐뿌": "ppomppu",
+    "루리웹": "ruliweb",
+    "Zod": "zod",
+    "어미새": "eomisae",
+    "퀘이사존": "quasarzone",
+}
 
-    if category != "all":
-        query = query.filter(HotDeal.category == category)
 
-    if shipping_free:
-        query = query.filter(HotDeal.shipping.like("%무료%"))
+def load_stats(db: Session) -> dict:
+    summary = load_deal_summary(db)
+    stats = {"total": summary["total"]}
+    for source, key in STATS_SOURCE_KEYS.items():
+        stats[key] = summary["by_source"].get(source, 0)
+    stats["freshness"] = summary["freshness"]
+    return stats
 
-    if price_range != "all":
-        if price_range == "0-5만":
-            query = query.filter(
-                and_(HotDeal.price_value > 0, HotDeal.price_value <= 50000)
-            )
-        elif price_range == "5-10만":
-            query = query.filter(
-                and_(HotDeal.price_value > 50000, HotDeal.price_value <= 100000)
-            )
-        elif price_range == "10-20만":
-            query = query.filter(
-                and_(HotDeal.price_value > 100000, HotDeal.price_value <= 200000)
-            )
-        elif price_range == "20만+":
-            query = query.filter(HotDeal.price_value > 200000)
 
-    all_deals = query.all()
-    total = len(all_deals)
+@app.get("/api/stats")
+async def stats(request: Request):
+    generation = data_generations.token()
+    headers = conditional_headers(request, generation)
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    body = await response_cache.get_or_load(
+        f"stats@{generation}", lambda: run_db(lambda db: dumps(load_stats(db)))
+    )
+    return json_bytes_response(body, headers)
 
-    if sort == "oldest":
-        all_deals.sort(key=lambda x: x.created_at)
-    else:
-        all_deals.sort(key=lambda x: x.created_at, reverse=True)
 
-    total_pages = max(1, (total + per_page - 1) // per_page)
-    offset = (page - 1) * per_page
-    paginated_deals = all_deals[offset : offset + per_page]
+DEAL_CATEGORIES = [
+    {"id": "가전/디지털", "name": "가전/디지털", "icon": "📱"},
+    {"id": "신세계/아웃렛", "name": "신세계/아웃렛", "icon": "👟"},
+    {"id": "뷰티/화장품", "name": "뷰티/화장품", "icon": "💄"},
+    {"id": "식품/건강", "name": "식품/건강", "icon": "🍎"},
+    {"id": "가구/인테리어", "name": "가구/인테리어", "icon": "🏠"},
+    {"id": "게임/취미", "name": "게임/취미", "icon": "🎮"},
+    {"id": "기타", "name": "기타", "icon": "📦"},
+]
+CATEGORIES_ETAG = make_etag(json.dumps(DEAL_CATEGORIES, ensure_ascii=False))
 
-    logger.info(
-        f"API 요청: source={source}, page={page}/{total_pages}, price_range={price_range}, shipping_free={shipping_free}, sort={sort} - {len(paginated_deals)}개 반환"
-    )
 
-    result = {
-        "deals": [deal.to_dict() for deal in paginated_deals],
-        "pagination": {
+@app.get("/api/categories")
+async def categories(request: Request):
+    headers = {"ETag": CATEGORIES_ETAG, "Cache-Control": "public, max-age=3600"}
+    if etag_matches(request.headers.get("if-none-match", ""), CATEGORIES_ETAG):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({"categories": DEAL_CATEGORIES}, headers=headers)
+
+
+def search_deals(
+    db: Session,
+    q: str,
+    generation: str,
+    use_fts: bool,
+    category: str,
+    price_range: str,
+    shipping_free: bool,
+    sort: str,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+):
+    query = db.query(HotDeal)
+    matches = None
+
+    if use_fts:
+        matches = fts_match_subquery(q)
+        query = query.join(matches, matches.c.deal_id == HotDeal.id)
+    elif q:
+        query = query.filter(HotDeal.title.like(make_like_pattern(q), escape="\\"))
+
+    query = apply_deal_filters(query, "all", category, shipping_free, price_range)
+    count_key = f"search:{q}:{price_range}:{category}:{shipping_free}@{generation}"
+
+    if sort == "relevance" and matches is not None:
+        total = cached_deal_count(count_key, query)
+        deals = (
+            query.order_by(matches.c.rank, HotDeal.created_at.desc())
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all()
+        )
+        pagination = {
             "page": page,
             "per_page": per_page,
             "total": total,
-            "total_pages": total_pages,
-        },
-    }
-    _hotdeals_cache[cache_key] = (now, result)
-    return result
+            "total_pages": max(1, (total + per_page - 1) // per_page),
+            "next_cursor": None,
+            "has_more": page * per_page < total,
+        }
+        return deals, pagination
 
+    if sort == "relevance":
+        sort = "latest"
+    return paginate_deals(query, sort, per_page, page, cursor, count_key=count_key)
 
-@app.get("/api/stats")
-async def stats(db: Session = Depends(get_db)):
-    total = db.query(HotDeal).count()
-    ppomppu_count = db.query(HotDeal).filter(HotDeal.source == "뽐뿌").count()
-    ruliweb_count = db.query(HotDeal).filter(HotDeal.source == "루리웹").count()
-    zod_count = db.query(HotDeal).filter(HotDeal.source == "Zod").count()
-    eomisae_count = db.query(HotDeal).filter(HotDeal.source == "어미새").count()
-    quasarzone_count = db.query(HotDeal).filter(HotDeal.source == "퀘이사존").count()
 
-    return {
-        "total": total,
-        "ppomppu": ppomppu_count,
-        "ruliweb": ruliweb_count,
-        "zod": zod_count,
-        "eomisae": eomisae_count,
-        "quasarzone": quasarzone_count,
-    }
+def load_search_page(db: Session, q: str, generation: str, *search_args) -> bytes:
+    use_fts = FTS_ENABLED and len(q) >= FTS_MIN_QUERY_LENGTH
 
+    try:
+        paginated_deals, pagination = search_deals(
+            db, q, generation, use_fts, *search_args
+        )
+    except OperationalError as e:
+        if not use_fts:
+            raise
+        logger.warning(f"FTS 검색 실패, LIKE 검색으로 대체: {e}")
+        db.rollback()
+        use_fts = False
+        paginated_deals, pagination = search_deals(
+            db, q, generation, use_fts, *search_args
+        )
 
-@app.get("/api/categories")
-async def categories():
-    return {
-        "categories": [
-            {"id": "가전/디지털", "name": "가전/디지털", "icon": "📱"},
-            {"id": "신세계/아웃렛", "name": "신세계/아웃렛", "icon": "👟"},
-            {"id": "뷰티/화장품", "name": "뷰티/화장품", "icon": "💄"},
-            {"id": "식품/건강", "name": "식품/건강", "icon": "🍎"},
-            {"id": "가구/인테리어", "name": "가구/인테리어", "icon": "🏠"},
-            {"id": "게임/취미", "name": "게임/취미", "icon": "🎮"},
-            {"id": "기타", "name": "기타", "icon": "📦"},
-        ]
-    }
+    return deal_list_body(
+        paginated_deals,
+        pagination=pagination,
+        query=q,
+        search_mode="fts" if use_fts else "like",
+    )
 
 
 @app.get("/api/search")
 async def search(
+    request: Request,
     q: str = Query(default="", min_length=1),
     category: str = "all",
     price_range: str = Query(
         default="all", regex="^(all|0-5만|5-10만|10-20만|20만\\+)$"
     ),
     shipping_free: bool = False,
-    sort: str = Query(default="latest", regex="^(latest|oldest)$"),
+    sort: str = Query(default="latest", regex="^(latest|oldest|relevance)$"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
 ):
-    query = db.query(HotDeal)
-
-    if q:
-        escaped_q = q.replace("%", r"\%").replace("_", r"\_")
-        query = query.filter(HotDeal.title.like(f"%{escaped_q}%"))
-
-    if category != "all":
-        query = query.filter(HotDeal.category == category)
-
-    if shipping_free:
-        query = query.filter(HotDeal.shipping.like("%무료%"))
-
-    if price_range != "all":
-        if price_range == "0-5만":
-            query = query.filter(
-                and_(HotDeal.price_value > 0, HotDeal.price_value <= 50000)
-            )
-        elif price_range == "5-10만":
-            query = query.filter(
-                and_(HotDeal.price_value > 50000, HotDeal.price_value <= 100000)
-            )
-        elif price_range == "10-20만":
-            query = query.filter(
-                and_(HotDeal.price_value > 100000, HotDeal.price_value <= 200000)
-            )
-        elif price_range == "20만+":
-            query = query.filter(HotDeal.price_value > 200000)
-
-    all_deals = query.all()
-    total = len(all_deals)
-
-    if sort == "oldest":
-        all_deals.sort(key=lambda x: x.created_at)
-    else:
-        all_deals.sort(key=lambda x: x.created_at, reverse=True)
-
-    total_pages = max(1, (total + per_page - 1) // per_page)
-    offset = (page - 1) * per_page
-    paginated_deals = all_deals[offset : offset + per_page]
-
-    return {
-        "deals": [deal.to_dict() for deal in paginated_deals],
-        "pagination": {
-            "page": page,
-            "per_page": per_page,
-            "total": total,
-            "total_pages": total_pages,
-        },
-        "query": q,
-    }
+    generation = data_generations.token("all", category)
+    headers = conditional_headers(request, generation)
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    search_args = (category, price_range, shipping_free, sort, page, per_page, cursor)
+    cache_key = "search:" + ":".join(str(arg) for arg in (q, *search_args))
+    body = await response_cache.get_or_load(
+        f"{cache_key}@{generation}",
+        lambda: run_db(load_search_page, q, generation, *search_args),
+    )
+    return json_bytes_response(body, headers)
 
 
 @app.get("/api/deals/{deal_id}/comments")
@@ -433,58 +677,36 @@ async def delete_comment(
     return {"status": "삭제 완료"}
 
 
-@app.get("/api/bookmarks")
-async def get_bookmarks(
-    request: Request,
-    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
-    db: Session = Depends(get_db),
-):
-    user = None
-    if x_access_token:
-        try:
-            payload = decode_token(x_access_token)
-            user_id = payload.get("sub")
-            if user_id:
-                user = db.query(User).filter(User.id == int(user_id)).first()
-        except Exception:
-            pass
+def find_token_user(db: Session, x_access_token: Optional[str]) -> Optional[User]:
+    if not x_access_token:
+        return None
+    try:
+        payload = decode_token(x_access_token)
+        user_id = payload.get("sub")
+        if user_id:
+            return db.query(User).filter(User.id == int(user_id)).first()
+    except Exception:
+        pass
+    return None
 
+
+def list_bookmarks(db: Session, x_access_token: Optional[str]) -> dict:
+    user = find_token_user(db, x_access_token)
     if not user:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다")
 
-    bookmarks = (
-        db.query(Bookmark)
+    deals = (
+        db.query(HotDeal)
+        .join(Bookmark, Bookmark.deal_id == HotDeal.id)
         .filter(Bookmark.user_id == str(user.id))
         .order_by(Bookmark.created_at.desc())
         .all()
     )
+    return {"bookmarks": [deal.to_dict() for deal in deals]}
 
-    deals = []
-    for bm in bookmarks:
-        deal = db.query(HotDeal).filter(HotDeal.id == bm.deal_id).first()
-        if deal:
-            deals.append(deal.to_dict())
-
-    return {"bookmarks": deals}
-
-
-@app.post("/api/bookmarks/{deal_id}")
-async def add_bookmark(
-    deal_id: int,
-    request: Request,
-    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
-    db: Session = Depends(get_db),
-):
-    user = None
-    if x_access_token:
-        try:
-            payload = decode_token(x_access_token)
-            user_id = payload.get("sub")
-            if user_id:
-                user = db.query(User).filter(User.id == int(user_id)).first()
-        except Exception:
-            pass
 
+def create_bookmark(db: Session, deal_id: int, x_access_token: Optional[str]) -> dict:
+    user = find_token_user(db, x_access_token)
     if not user:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다")
 
@@ -511,23 +733,8 @@ async def add_bookmark(
     return {"status": "added", "bookmark": bookmark.to_dict()}
 
 
-@app.delete("/api/bookmarks/{deal_id}")
-async def remove_bookmark(
-    deal_id: int,
-    request: Request,
-    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
-    db: Session = Depends(get_db),
-):
-    user = None
-    if x_access_token:
-        try:
-            payload = decode_token(x_access_token)
-            user_id = payload.get("sub")
-            if user_id:
-                user = db.query(User).filter(User.id == int(user_id)).first()
-        except Exception:
-            pass
-
+def delete_bookmark(db: Session, deal_id: int, x_access_token: Optional[str]) -> dict:
+    user = find_token_user(db, x_access_token)
     if not user:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다")
 
@@ -545,6 +752,32 @@ async def remove_bookmark(
     return {"status": "deleted"}
 
 
+@app.get("/api/bookmarks")
+async def get_bookmarks(
+    request: Request,
+    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
+):
+    return await run_db(list_bookmarks, x_access_token)
+
+
+@app.post("/api/bookmarks/{deal_id}")
+async def add_bookmark(
+    deal_id: int,
+    request: Request,
+    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
+):
+    return await run_db(create_bookmark, deal_id, x_access_token)
+
+
+@app.delete("/api/bookmarks/{deal_id}")
+async def remove_bookmark(
+    deal_id: int,
+    request: Request,
+    x_access_token: Optional[str] = Header(default=None, alias="X-Access-Token"),
+):
+    return await run_db(delete_bookmark, deal_id, x_access_token)
+
+
 @app.get("/api/deals/{deal_id}/price-history")
 async def get_price_history(deal_id: int, db: Session = Depends(get_db)):
     deal = db.query(HotDeal).filter(HotDeal.id == deal_id).first()
@@ -886,7 +1119,7 @@ async def list_available_models(
 
 @app.get("/api/search/ai")
 @limiter.limit("10/minute")
-async def search_ai(request: Request, query: str, db: Session = Depends(get_db)):
+async def search_ai(request: Request, query: str):
     if not query:
         return {"answer": "검색어를 입력해주세요."}
 
@@ -894,82 +1127,47 @@ async def search_ai(request: Request, query: str, db: Session = Depends(get_db))
         return {"answer": "서버에 Google API 키가 설정되지 않았습니다."}
 
     try:
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
-            temperature=0,
-            google_api_key=GOOGLE_API_KEY,
-            transport="rest",
-        )
-
-        expansion_prompt = ChatPromptTemplate.from_template(
-            """사용자가 쇼핑몰에서 '{question}'(이)라고 검색했어.
-            이 의도를 만족시킬 수 있는 구체적인 상품 카테고리나 키워드 5개를 한국어로 나열해줘.
-            
-            규칙:
-            1. 쉼표(,)로만 구분해.
-            2. 설명 없이 단어만 출력해.
-            3. 예시: 입력 '컴퓨터' -> 출력 '노트북,데스크탑,모니터,마우스,키보드'
-            """
-        )
-
-        expansion_chain = expansion_prompt | llm | StrOutputParser()
-        expanded_keywords_str = expansion_chain.invoke({"question": query})
-
-        keywords = [k.strip() for k in expanded_keywords_str.split(",")]
-        keywords.insert(0, query)
-        keywords = list(set(keywords))
-
-        vectorstore = get_vectorstore()
-        if not vectorstore:
-            return {"answer": "벡터 DB 연결 실패"}
+        return await run_ai_search(query)
 
-        from langchain_core.documents import Document
-        from core.helpers import make_rag_id
-
-        combined_query = " OR ".join(keywords)
-        results = vectorstore.similarity_search(combined_query, k=10)
-
-        context_deals = []
-        for doc in results:
-            link = doc.metadata.get("link", "")
-            deal = db.query(HotDeal).filter(HotDeal.link == link).first()
-            if deal:
-                context_deals.append(deal.to_dict())
+    except Exception as e:
+        logger.error(f"AI 검색 오류: {e}")
+        return {"answer": f"검색 중 오류가 발생했습니다: {str(e)}"}
 
-        if not context_deals:
-            return {
-                "answer": f"'{query}' 관련 결과를 찾지 못했습니다.",
-                "deals": [],
-            }
 
-        deals_text = "\n".join(
-            [
-                f"- [{d['source']}] {d['title']} | {d['price']} | {d['shipping']}"
-                for d in context_deals
-            ]
-        )
+def sse_event(event: str, data) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
 
-        answer_prompt = ChatPromptTemplate.from_template(
-            """다음은 쇼핑 검색 '{query}'에 대한 결과입니다:
-            {context}
-            
-            위 결과를 바탕으로 사용자에게 최적의 쇼핑 추천 답변을 한국어로 작성해주세요.
-            3-5개 추천하며, 각 추천마다 간단한 이유도 포함해주세요.
-            """
-        )
 
-        answer_chain = answer_prompt | llm | StrOutputParser()
-        answer = answer_chain.invoke({"query": query, "context": deals_text})
+@app.get("/api/search/ai/stream")
+@limiter.limit("10/minute")
+async def search_ai_stream(request: Request, query: str):
+    """AI 검색 SSE: deals 이벤트(딜 카드) → token 이벤트(답변 조각) → done"""
+
+    async def events():
+        if not query:
+            yield sse_event("error", {"message": "검색어를 입력해주세요."})
+            return
+        if not GOOGLE_API_KEY:
+            yield sse_event(
+                "error", {"message": "서버에 Google API 키가 설정되지 않았습니다."}
+            )
+            return
 
-        return {
-            "answer": answer,
-            "deals": context_deals,
-            "expanded_keywords": keywords,
-        }
+        try:
+            async for event, data in stream_ai_search(query):
+                if await request.is_disconnected():
+                    logger.info(f"AI 검색 스트림 중단 (클라이언트 연결 종료): {query}")
+                    return
+                yield sse_event(event, data)
+        except Exception as e:
+            logger.error(f"AI 검색 스트림 오류: {e}")
+            yield sse_event("error", {"message": f"검색 중 오류가 발생했습니다: {str(e)}"})
 
-    except Exception as e:
-        logger.error(f"AI 검색 오류: {e}")
-        return {"answer": f"검색 중 오류가 발생했습니다: {str(e)}"}
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/api/auth/me")
@@ -998,29 +1196,24 @@ async def get_me(
 async def sync_rag(
     secret: str = "",
     x_admin_secret: Optional[str] = Header(default=None, alias="X-Admin-Secret"),
-    db: Session = Depends(get_db),
+    resume: bool = True,
 ):
     require_admin_access(secret=secret, x_admin_secret=x_admin_secret)
 
     if not GOOGLE_API_KEY:
         return {"error": "Google API Key 없음"}
 
-    try:
-        from services.database import make_rag_document
-
-        vectorstore = get_vectorstore()
-        if not vectorstore:
-            return {"error": "VectorStore 초기화 실패"}
+    job = start_rag_sync(resume=resume)
+    return {"status": job.status, "job_id": job.job_id, "resumed_from": job.resumed_from}
 
-        all_deals = db.query(HotDeal).all()
-        documents = [make_rag_document(deal.to_dict()) for deal in all_deals]
 
-        upsert_rag_documents(vectorstore, documents)
-
-        return {"status": "success", "synced": len(documents)}
-    except Exception as e:
-        logger.error(f"RAG Sync 오류: {e}")
-        return {"error": str(e)}
+@app.get("/api/admin/sync-rag/status")
+async def sync_rag_status(
+    secret: str = "",
+    x_admin_secret: Optional[str] = Header(default=None, alias="X-Admin-Secret"),
+):
+    require_admin_access(secret=secret, x_admin_secret=x_admin_secret)
+    return rag_sync_status()
 
 
 @app.get("/api/admin/stats")
@@ -1031,38 +1224,26 @@ async def admin_stats(
 ):
     require_admin_access(secret=secret, x_admin_secret=x_admin_secret)
 
-    total_deals = db.query(HotDeal).count()
-    total_users = db.query(User).count()
-    total_comments = db.query(Comment).count()
-    total_bookmarks = db.query(Bookmark).count()
-    total_telegram_users = db.query(TelegramUser).count()
-
-    source_stats = {}
-    for source in ["뽐뿌", "루리웹", "Zod", "어미새", "퀘이사존"]:
-        count = db.query(HotDeal).filter(HotDeal.source == source).count()
-        source_stats[source] = count
-
-    category_stats = {}
-    for category in [
-        "가전/디지털",
-        "신세계/아웃렛",
-        "뷰티/화장품",
-        "식품/건강",
-        "가구/인테리어",
-        "게임/취미",
-        "기타",
-    ]:
-        count = db.query(HotDeal).filter(HotDeal.category == category).count()
-        category_stats[category] = count
+    summary = load_deal_summary(db)
+    total_users, total_comments, total_bookmarks, total_telegram_users = db.query(
+        *[
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in (User, Comment, Bookmark, TelegramUser)
+        ]
+    ).one()
 
     return {
-        "total_deals": total_deals,
+        "total_deals": summary["total"],
         "total_users": total_users,
         "total_comments": total_comments,
         "total_bookmarks": total_bookmarks,
         "total_telegram_users": total_telegram_users,
-        "source_stats": source_stats,
-        "category_stats": category_stats,
+        "source_stats": {
+            **{source: 0 for source in STATS_SOURCE_KEYS},
+            **summary["by_source"],
+        },
+        "category_stats": summary["by_category"],
+        "freshness": summary["freshness"],
     }
 
 
@@ -1121,8 +1302,12 @@ async def admin_delete_deal(
     if not deal:
         raise HTTPException(status_code=404, detail="딜을 찾을 수 없습니다")
 
+    source, category = deal.source, deal.category
     db.delete(deal)
+    db.flush()
+    refresh_deal_counters(db, [(source, category)])
     db.commit()
+    data_generations.bump([source], [category])
 
     return {"status": "deleted", "deal_id": deal_id}
 
@@ -1187,14 +1372,45 @@ async def health_db(db: Session = Depends(get_db)):
 
 @app.get("/health/vectorstore")
 async def health_vectorstore():
-    try:
-        vectorstore = get_vectorstore()
-        if vectorstore:
-            return {"status": "ok", "vectorstore": "connected"}
-        return {"status": "error", "vectorstore": "not_initialized"}
-    except Exception as e:
-        logger.error(f"VectorStore 헬스체크 실패: {e}")
-        return {"status": "error", "vectorstore": "error", "error": str(e)}
+    health = vectorstore_health()
+    if health["status"] == "error":
+        logger.error(f"VectorStore 헬스체크 실패: {health['error']}")
+    return {
+        "status": "ok" if health["status"] == "ok" else "error",
+        "vectorstore": "connected" if health["status"] == "ok" else health["status"],
+        **{k: v for k, v in health.items() if k != "status"},
+    }
+
+
+@app.get("/health/cache")
+async def health_cache():
+    return {
+        "status": "ok",
+        "response": response_cache.stats(),
+        "count": count_cache.stats(),
+        "ai_answer": answer_cache.stats(),
+        "ai_keywords": keyword_cache.stats(),
+        "generations": data_generations.stats(),
+    }
+
+
+@app.get("/health/http")
+async def health_http():
+    return {"status": "ok", "http2": http_clients.http2, "pools": http_clients.stats()}
+
+
+@app.get("/health/crawl")
+async def health_crawl():
+    return {
+        "status": "ok",
+        "sources": source_changes.stats(),
+        "pagination": known_links.stats(),
+    }
+
+
+@app.get("/health/loop")
+async def health_loop():
+    return {"status": "ok", "loop_lag": loop_lag.stats(), "parse": parse_executor_stats()}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+from enum import Enum as PyEnum
+
+
+class Category(PyEnum):
+    HOME_APPLIANCES = "가전/디지털"
+    FASHION = "신세계/아웃렛"
+    BEAUTY = "뷰티/화장품"
+    FOOD = "식품/건강"
+    FURNITURE = "가구/인테리어"
+    HOBBY = "게임/취미"
+    OTHER = "기타"
+
+
+CATEGORY_KEYWORDS = {
+    Category.HOME_APPLIANCES: [
+        "노트북",
+        "태블릿",
+        "스마트폰",
+        "모니터",
+        "키보드",
+        "마우스",
+        "이어폰",
+        "충전기",
+        "에어팟",
+        "와이파이",
+        "SSD",
+        "메모리",
+        "HDD",
+        "웹캠",
+        "카메라",
+        "프린터",
+        "라즈베리파이",
+        "아이폰",
+        "갤럭시",
+        "애플워치",
+        "갤워치",
+        "헤드폰",
+        "스피커",
+        "TV",
+        "냉장고",
+        "세탁기",
+        "에어컨",
+        "청소기",
+        "전자레인지",
+        "오븐",
+        "믹서기",
+        "커피머신",
+        "LG",
+        "삼성",
+        "LG트롬",
+        "드럼세탁기",
+        "냉온숨소",
+        "공기청정기",
+        "加湿器",
+        "，空气清净기",
+    ],
+    Category.FASHION: [
+        "신발",
+        "가방",
+        "지갑",
+        "벨트",
+        "가죽",
+        "명품",
+        "나이키",
+        "아디다스",
+        "슈콤",
+        "구두",
+        "로퍼",
+        "스니커즈",
+        "샌들",
+        "슬리퍼",
+        "부츠",
+        "运动鞋",
+        "가이걸",
+        "미스키",
+        "멀버리",
+        "보세",
+        "시골쌀",
+        "패션",
+        "옷",
+        "의류",
+        "티셔츠",
+        "셔츠",
+        "바지",
+        "치마",
+        "원피스",
+        "재킷",
+        "코트",
+        "점퍼",
+        "니트",
+        "후드",
+        "양말",
+        "모자",
+        "스카프",
+        "넥타이",
+        "쥬얼리",
+        "액세서리",
+        "루이비통",
+        "구찌",
+        "샤넬",
+        "에르메스",
+        "프라다",
+        "발망",
+        "버버리",
+    ],
+    Category.BEAUTY: [
+        "화장품",
+        "스킨케어",
+        "메이크업",
+        "향수",
+        "클렌징",
+        "선크림",
+        "바디",
+        "헤어",
+        "미용",
+        "에뛰드",
+        "라ashes",
+        "미쟝",
+        "려",
+        "아모르파시",
+        "더후",
+        "쿠incare",
+        "톤크림",
+        "마스카라",
+        "아이섀도우",
+        "립스틱",
+        "립밤",
+        "핸드크림",
+        "바디로션",
+        "바디워시",
+        "샴푸",
+        "컨디셔너",
+        "헤어에센스",
+        "드라이기",
+        "고데기",
+    ],
+    Category.FOOD: [
+        "음식",
+        "식품",
+        "커피",
+        "과일",
+        "건강",
+        "비타민",
+        "유산균",
+        "다이어트",
+        "스포츠",
+        "요가",
+        "운동",
+        "쥬스",
+        "음료",
+        "차",
+        "꿀",
+        "떡",
+        "한정",
+        "한식",
+        "중식",
+        "일식",
+        "양식",
+        "패스트푸드",
+        "도시락",
+        "반찬",
+        "김치",
+        "젓갈",
+        "장아찌",
+        "묵",
+        "두부",
+        "달걀",
+        "고기",
+        "소고기",
+        "돼지고기",
+        "닭고기",
+        "양고기",
+        "해산물",
+        "生선",
+        "건어물",
+        "바다",
+        "山谷",
+    ],
+    Category.FURNITURE: [
+        "가구",
+        "침구",
+        "쿠션",
+        "조명",
+        "인테리어",
+        "커튼",
+        "러그",
+        "수납",
+        "整理",
+        "책상",
+        "의자",
+        "책장",
+        "서랍",
+        "행거",
+        "옷장",
+        "화장대",
+        "침대",
+        "매트리스",
+        "토퍼",
+        "이불",
+        "pillow",
+        "쿠션",
+        "방석",
+        "카페트",
+        "러그",
+        "카펫",
+        "두께",
+        "학습 desk",
+        "컴퓨터 desk",
+        "standing desk",
+        "조명",
+        "스탠드",
+        "천장등",
+        "벽등",
+        "LED",
+        "무드등",
+        "인테리어소품",
+    ],
+    Category.HOBBY: [
+        "게임",
+        "보드게임",
+        "장난감",
+        "피규어",
+        "굿즈",
+        "만화",
+        "애니",
+        "書籍",
+        "음악",
+        "악기",
+        "캠핑",
+        "등산",
+        "자전거",
+        "피씨방",
+        "노트",
+        "문구",
+        "플래너",
+        "다이어리",
+        "스티커",
+        "마스킹테이프",
+        "키링",
+        "인형",
+        " plush",
+        "레고",
+        "반다이",
+        "마리오",
+        "짱구",
+        "고염전",
+        "테니스",
+        "배드민턴",
+        "탁구",
+        "볼링",
+        "스쿠버",
+        "서핑",
+        "스키",
+        "보드",
+        "당구",
+        "포켓볼",
+    ],
+}
+
+
+def classify_category(title: str) -> str:
+    """제목 키워드 매칭으로 카테고리 분류"""
+    title_lower = title.lower()
+
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword.lower() in title_lower:
+                return category.value
+
+    return Category.OTHER.value
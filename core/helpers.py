@@ -62,10 +62,48 @@ def clean_deal_title(title: str) -> str:
     return cleaned.strip()
 
 
+FTS_MIN_QUERY_LENGTH = 3
+
+
+def make_fts_phrase(query: str) -> str:
+    """FTS5 MATCH용 phrase 문자열 (trigram 기준 부분 문자열 검색)"""
+    return '"' + query.replace('"', '""') + '"'
+
+
+def make_like_pattern(query: str) -> str:
+    """LIKE 부분 일치 패턴 (escape="\\" 와 함께 사용)"""
+    escaped = query.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
+    return f"%{escaped}%"
+
+
+def make_etag(*parts) -> str:
+    """응답 식별 요소로 strong ETag 생성"""
+    digest = hashlib.sha1(
+        "|".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (nginx gzip이 붙이는 W/ 약한 ETag도 허용)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates
+    )
+
+
 def make_rag_id(link: str) -> str:
     return hashlib.sha256(link.encode("utf-8")).hexdigest()
 
 
+def make_content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def is_valid_admin_secret(candidate: str, admin_secret: str) -> bool:
     return (
         bool(admin_secret)
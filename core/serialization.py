@@ -0,0 +1,40 @@
+import os
+import threading
+from collections import OrderedDict
+
+import orjson
+
+DEAL_FRAGMENT_CACHE_SIZE = int(os.getenv("DEAL_FRAGMENT_CACHE_SIZE", 5000))
+
+_deal_fragments = OrderedDict()
+_deal_fragments_lock = threading.Lock()
+
+
+def dumps(obj) -> bytes:
+    return orjson.dumps(obj)
+
+
+def deal_fragment(deal) -> bytes:
+    """딜 1건의 JSON bytes ((id, updated_at) 기준 메모이즈)"""
+    key = (deal.id, deal.updated_at)
+    with _deal_fragments_lock:
+        fragment = _deal_fragments.get(key)
+        if fragment is not None:
+            _deal_fragments.move_to_end(key)
+            return fragment
+
+    fragment = orjson.dumps(deal.to_dict())
+    with _deal_fragments_lock:
+        _deal_fragments[key] = fragment
+        while len(_deal_fragments) > DEAL_FRAGMENT_CACHE_SIZE:
+            _deal_fragments.popitem(last=False)
+    return fragment
+
+
+def deal_list_body(deals, **fields) -> bytes:
+    """{"deals": [...], **fields} 응답 본문을 딜 조각 bytes를 이어 붙여 생성"""
+    parts = [b'{"deals":[', b",".join(deal_fragment(deal) for deal in deals), b"]"]
+    for key, value in fields.items():
+        parts.append(b"," + orjson.dumps(key) + b":" + orjson.dumps(value))
+    parts.append(b"}")
+    return b"".join(parts)
@@ -10,275 +10,22 @@ from sqlalchemy import (
     Index,
     Enum,
     JSON,
+    LargeBinary,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 import pytz
 import os
-from enum import Enum as PyEnum
+import logging
+from core.categories import CATEGORY_KEYWORDS, Category, classify_category  # noqa: F401
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 KST = pytz.timezone("Asia/Seoul")
 
 
-class Category(PyEnum):
-    HOME_APPLIANCES = "가전/디지털"
-    FASHION = "신세계/아웃렛"
-    BEAUTY = "뷰티/화장품"
-    FOOD = "식품/건강"
-    FURNITURE = "가구/인테리어"
-    HOBBY = "게임/취미"
-    OTHER = "기타"
-
-
-CATEGORY_KEYWORDS = {
-    Category.HOME_APPLIANCES: [
-        "노트북",
-        "태블릿",
-        "스마트폰",
-        "모니터",
-        "키보드",
-        "마우스",
-        "이어폰",
-        "충전기",
-        "에어팟",
-        "와이파이",
-        "SSD",
-        "메모리",
-        "HDD",
-        "웹캠",
-        "카메라",
-        "프린터",
-        "라즈베리파이",
-        "아이폰",
-        "갤럭시",
-        "애플워치",
-        "갤워치",
-        "헤드폰",
-        "스피커",
-        "TV",
-        "냉장고",
-        "세탁기",
-        "에어컨",
-        "청소기",
-        "전자레인지",
-        "오븐",
-        "믹서기",
-        "커피머신",
-        "LG",
-        "삼성",
-        "LG트롬",
-        "드럼세탁기",
-        "냉온숨소",
-        "공기청정기",
-        "加湿器",
-        "，空气清净기",
-    ],
-    Category.FASHION: [
-        "신발",
-        "가방",
-        "지갑",
-        "벨트",
-        "가죽",
-        "명품",
-        "나이키",
-        "아디다스",
-        "슈콤",
-        "구두",
-        "로퍼",
-        "스니커즈",
-        "샌들",
-        "슬리퍼",
-        "부츠",
-        "运动鞋",
-        "가이걸",
-        "미스키",
-        "멀버리",
-        "보세",
-        "시골쌀",
-        "패션",
-        "옷",
-        "의류",
-        "티셔츠",
-        "셔츠",
-        "바지",
-        "치마",
-        "원피스",
-        "재킷",
-        "코트",
-        "점퍼",
-        "니트",
-        "후드",
-        "양말",
-        "모자",
-        "스카프",
-        "넥타이",
-        "쥬얼리",
-        "액세서리",
-        "루이비통",
-        "구찌",
-        "샤넬",
-        "에르메스",
-        "프라다",
-        "발망",
-        "버버리",
-    ],
-    Category.BEAUTY: [
-        "화장품",
-        "스킨케어",
-        "메이크업",
-        "향수",
-        "클렌징",
-        "선크림",
-        "바디",
-        "헤어",
-        "미용",
-        "에뛰드",
-        "라ashes",
-        "미쟝",
-        "려",
-        "아모르파시",
-        "더후",
-        "쿠incare",
-        "톤크림",
-        "마스카라",
-        "아이섀도우",
-        "립스틱",
-        "립밤",
-        "핸드크림",
-        "바디로션",
-        "바디워시",
-        "샴푸",
-        "컨디셔너",
-        "헤어에센스",
-        "드라이기",
-        "고데기",
-    ],
-    Category.FOOD: [
-        "음식",
-        "식품",
-        "커피",
-        "과일",
-        "건강",
-        "비타민",
-        "유산균",
-        "다이어트",
-        "스포츠",
-        "요가",
-        "운동",
-        "쥬스",
-        "음료",
-        "차",
-        "꿀",
-        "떡",
-        "한정",
-        "한식",
-        "중식",
-        "일식",
-        "양식",
-        "패스트푸드",
-        "도시락",
-        "반찬",
-        "김치",
-        "젓갈",
-        "장아찌",
-        "묵",
-        "두부",
-        "달걀",
-        "고기",
-        "소고기",
-        "돼지고기",
-        "닭고기",
-        "양고기",
-        "해산물",
-        "生선",
-        "건어물",
-        "바다",
-        "山谷",
-    ],
-    Category.FURNITURE: [
-        "가구",
-        "침구",
-        "쿠션",
-        "조명",
-        "인테리어",
-        "커튼",
-        "러그",
-        "수납",
-        "整理",
-        "책상",
-        "의자",
-        "책장",
-        "서랍",
-        "행거",
-        "옷장",
-        "화장대",
-        "침대",
-        "매트리스",
-        "토퍼",
-        "이불",
-        "pillow",
-        "쿠션",
-        "방석",
-        "카페트",
-        "러그",
-        "카펫",
-        "두께",
-        "학습 desk",
-        "컴퓨터 desk",
-        "standing desk",
-        "조명",
-        "스탠드",
-        "천장등",
-        "벽등",
-        "LED",
-        "무드등",
-        "인테리어소품",
-    ],
-    Category.HOBBY: [
-        "게임",
-        "보드게임",
-        "장난감",
-        "피규어",
-        "굿즈",
-        "만화",
-        "애니",
-        "書籍",
-        "음악",
-        "악기",
-        "캠핑",
-        "등산",
-        "자전거",
-        "피씨방",
-        "노트",
-        "문구",
-        "플래너",
-        "다이어리",
-        "스티커",
-        "마스킹테이프",
-        "키링",
-        "인형",
-        " plush",
-        "레고",
-        "반다이",
-        "마리오",
-        "짱구",
-        "고염전",
-        "테니스",
-        "배드민턴",
-        "탁구",
-        "볼링",
-        "스쿠버",
-        "서핑",
-        "스키",
-        "보드",
-        "당구",
-        "포켓볼",
-    ],
-}
-
-
 class User(Base):
     __tablename__ = "users"
 
@@ -313,6 +60,9 @@ class HotDeal(Base):
     created_at = Column(
         DateTime, default=lambda: datetime.now(KST).replace(tzinfo=None), index=True
     )
+    updated_at = Column(
+        DateTime, default=lambda: datetime.now(KST).replace(tzinfo=None)
+    )
 
     comments = relationship(
         "Comment", back_populates="deal", cascade="all, delete-orphan"
@@ -412,6 +162,24 @@ class RuliwebThumbnail(Base):
     )
 
 
+class EmbeddingCache(Base):
+    """page_content SHA-256 기준 임베딩 캐시 (float32 bytes)"""
+
+    __tablename__ = "embedding_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    model = Column(String, primary_key=True)
+    dimensions = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)
+    created_at = Column(
+        DateTime, default=lambda: datetime.now(KST).replace(tzinfo=None)
+    )
+    # 캐시 적중/재저장 시 갱신 (정리 기준)
+    last_used_at = Column(
+        DateTime, default=lambda: datetime.now(KST).replace(tzinfo=None)
+    )
+
+
 class Bookmark(Base):
     __tablename__ = "bookmarks"
 
@@ -468,33 +236,102 @@ class PriceHistory(Base):
         }
 
 
-def classify_category(title: str) -> str:
-    """제목 키워드 매칭으로 카테고리 분류"""
-    title_lower = title.lower()
+class DealCounter(Base):
+    """소스/카테고리별 핫딜 수 집계 (적재/정리 시 증분 갱신)"""
+
+    __tablename__ = "deal_counters"
+
+    source = Column(String, primary_key=True)
+    category = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    newest_created_at = Column(DateTime)
 
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword.lower() in title_lower:
-                return category.value
 
-    return Category.OTHER.value
+FTS_TOKENIZER = "trigram"
 
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS hotdeals_fts_insert AFTER INSERT ON hotdeals BEGIN
+        INSERT INTO deals_fts(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS hotdeals_fts_delete AFTER DELETE ON hotdeals BEGIN
+        INSERT INTO deals_fts(deals_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS hotdeals_fts_update AFTER UPDATE OF title ON hotdeals BEGIN
+        INSERT INTO deals_fts(deals_fts, rowid, title) VALUES ('delete', old.id, old.title);
+        INSERT INTO deals_fts(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+]
 
-def create_fts_table(engine):
-    """FTS5 가상 테이블 생성 (검색용)"""
+
+def rebuild_fts_index(conn):
+    """hotdeals 전체로 deals_fts 인덱스 재구성"""
     from sqlalchemy import text
 
-    with engine.connect() as conn:
-        conn.execute(
-            text("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS deals_fts USING fts5(
-                title,
-                content='hotdeals',
-                content_rowid='id'
-            )
-        """)
+    conn.execute(text("INSERT INTO deals_fts(deals_fts) VALUES ('rebuild')"))
+
+
+def create_fts_table(engine) -> bool:
+    """FTS5 가상 테이블 + 동기화 트리거 생성 (검색용, trigram 토크나이저)"""
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    try:
+        with engine.begin() as conn:
+            existing_sql = conn.execute(
+                text(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'deals_fts'"
+                )
+            ).scalar()
+
+            # 이전 버전(unicode61 토크나이저)으로 만든 테이블은 한국어 부분 검색이 안 되므로 재생성
+            if existing_sql and FTS_TOKENIZER not in existing_sql:
+                conn.execute(text("DROP TABLE deals_fts"))
+                existing_sql = None
+
+            if not existing_sql:
+                conn.execute(
+                    text(f"""
+                    CREATE VIRTUAL TABLE deals_fts USING fts5(
+                        title,
+                        content='hotdeals',
+                        content_rowid='id',
+                        tokenize='{FTS_TOKENIZER}'
+                    )
+                """)
+                )
+
+            for trigger_sql in FTS_TRIGGERS:
+                conn.execute(text(trigger_sql))
+
+            if not existing_sql:
+                rebuild_fts_index(conn)
+        return True
+    except OperationalError as e:
+        logger.warning(f"⚠️ FTS5({FTS_TOKENIZER}) 사용 불가, LIKE 검색으로 동작합니다: {e}")
+        return False
+
+
+def fts_match_subquery(q: str):
+    """deals_fts MATCH 결과 (deal_id, bm25 rank)"""
+    from sqlalchemy import column, func, literal_column, select, table
+    from core.helpers import make_fts_phrase
+
+    fts = table("deals_fts", column("rowid"))
+    return (
+        select(
+            fts.c.rowid.label("deal_id"),
+            func.bm25(literal_column("deals_fts")).label("rank"),
         )
-        conn.commit()
+        .select_from(fts)
+        .where(literal_column("deals_fts").op("MATCH")(make_fts_phrase(q)))
+        .subquery()
+    )
 
 
 def ensure_sqlite_schema(engine):
@@ -523,6 +360,28 @@ def ensure_sqlite_schema(engine):
                 text("UPDATE hotdeals SET price_value = 0 WHERE price_value IS NULL")
             )
 
+        if "updated_at" not in columns:
+            conn.execute(text("ALTER TABLE hotdeals ADD COLUMN updated_at DATETIME"))
+            conn.execute(
+                text("UPDATE hotdeals SET updated_at = created_at WHERE updated_at IS NULL")
+            )
+
+        embedding_columns = {
+            row[1]
+            for row in conn.execute(
+                text("PRAGMA table_info(embedding_cache)")
+            ).fetchall()
+        }
+        if "last_used_at" not in embedding_columns:
+            conn.execute(
+                text("ALTER TABLE embedding_cache ADD COLUMN last_used_at DATETIME")
+            )
+            conn.execute(
+                text(
+                    "UPDATE embedding_cache SET last_used_at = created_at WHERE last_used_at IS NULL"
+                )
+            )
+
         indexes = {
             row[1]
             for row in conn.execute(text("PRAGMA index_list(hotdeals)")).fetchall()
@@ -542,7 +401,9 @@ def ensure_sqlite_schema(engine):
                 conn.execute(text(idx_sql))
 
 
-if os.getenv("APP_ENV") == "production":
+if os.getenv("SQLITE_DB_PATH"):
+    db_path = os.getenv("SQLITE_DB_PATH")
+elif os.getenv("APP_ENV") == "production":
     db_path = "/data/hotdeals.db"
 else:
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -562,4 +423,4 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base.metadata.create_all(bind=engine)
 ensure_sqlite_schema(engine)
-create_fts_table(engine)
+FTS_ENABLED = create_fts_table(engine)
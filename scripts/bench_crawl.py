@@ -0,0 +1,138 @@
+"""크롤러 녹화/재생 벤치마크 (소스별 fetch / parse / classify / ingest 처리량)
+
+사용법:
+  녹화: python scripts/bench_crawl.py --record [--snapshots DIR]
+        실제 사이트를 한 번 크롤링하며 응답을 DIR/<소스>/<시각>-<URL 해시>.html.gz 로 저장
+  재생: python scripts/bench_crawl.py [--snapshots DIR] [--rounds 5] [--at 20261018T120000]
+        저장된 스냅샷만으로 (네트워크 없이) 단계별 시간을 측정
+
+- fetch: http_clients.get (재생 트랜스포트) 로 목록 페이지 받기
+- parse: services.parsers 소스별 파서 (분류 포함)
+- classify: 추출된 제목의 classify_category 만 따로
+- ingest: 임시 SQLite 에 bulk_upsert_deals (신규 삽입 / 변경 없는 재수집)
+- scrape: 실제 scrape_* 함수 전체 (파싱 프로세스 풀, 루리웹 og:image 포함)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def elapsed_ms(started: float, rounds: int = 1) -> float:
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+def per_second(count: int, ms: float) -> str:
+    return f"{count / ms * 1000:,.0f}/s" if ms else "-"
+
+
+async def record():
+    from services.http_client import http_clients
+    from services.scraper import SCRAPERS
+
+    http_clients.open()
+    try:
+        for source, scrape in SCRAPERS.items():
+            deals = await scrape()
+            print(f"{source}: {len(deals)}개 녹화")
+        print({source: stats["recorded"] for source, stats in http_clients.stats().items()})
+    finally:
+        await http_clients.aclose()
+
+
+async def replay(rounds: int):
+    from core.categories import classify_category
+    from models import SessionLocal
+    from services.database import bulk_upsert_deals
+    from services.http_client import http_clients
+    from services.parse_executor import shutdown_parse_executor
+    from services.parsers import PARSERS
+    from services.scraper import LIST_URLS, SCRAPERS
+
+    http_clients.open()
+    print(
+        f"{'source':<12}{'fetch':>9}{'parse':>9}{'classify':>10}{'ingest':>9}{'reingest':>10}"
+        f"{'scrape':>9}{'deals':>7}{'saved':>7}{'parse/s':>10}{'ingest/s':>10}"
+    )
+    try:
+        for source, parse in PARSERS.items():
+            started = time.perf_counter()
+            for _ in range(rounds):
+                response = await http_clients.get(source, LIST_URLS[source])
+            fetch_ms = elapsed_ms(started, rounds)
+            html = response.text
+
+            started = time.perf_counter()
+            for _ in range(rounds):
+                deals = parse(html)
+            parse_ms = elapsed_ms(started, rounds)
+
+            titles = [deal["title"] for deal in deals]
+            started = time.perf_counter()
+            for _ in range(rounds):
+                for title in titles:
+                    classify_category(title)
+            classify_ms = elapsed_ms(started, rounds)
+
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                result = bulk_upsert_deals(db, [dict(deal) for deal in deals])
+                ingest_ms = elapsed_ms(started)
+                started = time.perf_counter()
+                bulk_upsert_deals(db, [dict(deal) for deal in deals])
+                reingest_ms = elapsed_ms(started)
+            finally:
+                db.close()
+
+            started = time.perf_counter()
+            scraped = await SCRAPERS[source]()
+            scrape_ms = elapsed_ms(started)
+
+            print(
+                f"{source:<12}{fetch_ms:>7.1f}ms{parse_ms:>7.1f}ms{classify_ms:>8.2f}ms"
+                f"{ingest_ms:>7.1f}ms{reingest_ms:>8.1f}ms{scrape_ms:>7.0f}ms"
+                f"{len(scraped):>7}{result['new']:>7}"
+                f"{per_second(len(deals), parse_ms):>10}{per_second(result['new'], ingest_ms):>10}"
+            )
+        print({source: stats["replay"] for source, stats in http_clients.stats().items()})
+    finally:
+        await http_clients.aclose()
+        shutdown_parse_executor()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument(
+        "--snapshots", default=os.path.join(ROOT, "scripts", "fixtures", "crawl")
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--at", help="이 시각(YYYYmmddTHHMMSS) 이전 스냅샷만 재생")
+    args = parser.parse_args()
+
+    import logging
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # http_client 가 import 시점에 녹화/재생 설정을 읽으므로 먼저 지정
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench_crawl.db")
+        if args.record:
+            os.environ["CRAWL_RECORD_DIR"] = args.snapshots
+            asyncio.run(record())
+        else:
+            os.environ["CRAWL_REPLAY_DIR"] = args.snapshots
+            if args.at:
+                os.environ["CRAWL_REPLAY_AT"] = args.at
+            asyncio.run(replay(args.rounds))
+
+
+if __name__ == "__main__":
+    main()
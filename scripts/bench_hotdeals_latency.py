@@ -0,0 +1,130 @@
+"""크롤링(적재) 중 /api/hotdeals 지연시간(p50/p99) 벤치마크
+
+사용법: python scripts/bench_hotdeals_latency.py [--rows 20000] [--seconds 5]
+임시 SQLite 파일(SQLITE_DB_PATH)에 합성 핫딜을 채운 뒤, 같은 이벤트 루프에서
+동시 요청을 보내면서 다음 세 상황을 측정합니다.
+
+- idle: 적재 없음
+- crawl-on-loop: 기존 방식처럼 이벤트 루프에서 동기 세션으로 적재
+- crawl-db-thread: run_db로 DB 스레드 풀에서 적재 (현재 방식)
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SOURCES = ["뽐뿌", "루리웹", "Zod", "어미새", "퀘이사존"]
+
+
+def make_deals(start: int, count: int, tag: str = ""):
+    return [
+        {
+            "thumbnail": "",
+            "source": SOURCES[i % len(SOURCES)],
+            "author": "bench",
+            "title": f"벤치마크 상품 {i}{tag}",
+            "price": f"{(i % 300) * 1000}원",
+            "shipping": "무료배송" if i % 3 == 0 else "정보 없음",
+            "link": f"https://bench.local/deal/{i}",
+            "category": "기타",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+async def load_generator(client, seconds: float, concurrency: int):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            params = {
+                "source": random.choice(SOURCES + ["all"]),
+                "page": random.randint(1, 200),
+            }
+            started = time.perf_counter()
+            response = await client.get("/api/hotdeals", params=params)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies
+
+
+async def crawl_loop(mode: str, seconds: float, batch: int, next_id: list):
+    from models import HotDeal, SessionLocal
+    from services.database import bulk_upsert_deals
+    from services.db_executor import run_db
+
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        # 절반은 신규, 절반은 기존 딜 갱신
+        deals = make_deals(next_id[0], batch // 2) + make_deals(
+            random.randint(0, next_id[0] - batch), batch // 2, tag=" 갱신"
+        )
+        next_id[0] += batch // 2
+        if mode == "crawl-on-loop":
+            db = SessionLocal()
+            try:
+                bulk_upsert_deals(db, deals)
+                db.query(HotDeal).count()
+            finally:
+                db.close()
+        else:
+            await run_db(bulk_upsert_deals, deals)
+            await run_db(lambda db: db.query(HotDeal).count())
+        await asyncio.sleep(0)
+
+
+def summarize(name: str, latencies: list):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{name:<18}{len(ordered):>8}{statistics.median(ordered):>10.1f}ms"
+        f"{p99:>10.1f}ms{ordered[-1]:>10.1f}ms"
+    )
+
+
+async def main(args):
+    import httpx
+    import app
+    from models import SessionLocal
+    from services.database import bulk_upsert_deals
+
+    db = SessionLocal()
+    for start in range(0, args.rows, 2000):
+        bulk_upsert_deals(db, make_deals(start, min(2000, args.rows - start)))
+    db.close()
+    next_id = [args.rows]
+
+    transport = httpx.ASGITransport(app=app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'scenario':<18}{'requests':>8}{'p50':>12}{'p99':>12}{'max':>12}")
+        for scenario in ["idle", "crawl-on-loop", "crawl-db-thread"]:
+            app.response_cache.clear()
+            tasks = [load_generator(client, args.seconds, args.concurrency)]
+            if scenario != "idle":
+                tasks.append(crawl_loop(scenario, args.seconds, args.batch, next_id))
+            latencies = (await asyncio.gather(*tasks))[0]
+            summarize(scenario, latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench_hotdeals.db")
+        asyncio.run(main(args))
@@ -0,0 +1,83 @@
+"""크롤링 파싱 중 이벤트 루프 지연 벤치마크 (루프에서 직접 파싱 vs 파싱 프로세스 풀)
+
+사용법: python scripts/bench_loop_lag.py [--fixtures scripts/fixtures/html] [--rounds 5]
+저장된 5개 소스 목록 페이지를 rounds 번 파싱하는 동안 LoopLagMonitor 로
+이벤트 루프가 예정보다 늦게 깨어난 시간(= API 요청이 기다려야 했던 시간)을 측정합니다.
+
+- inline: 기존 방식 (이벤트 루프에서 BeautifulSoup 파싱)
+- process-pool: services.parse_executor.run_parse (PARSE_WORKERS 개 워커)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+async def measure(name: str, pages: list, rounds: int, parse) -> list:
+    from services.loop_monitor import LoopLagMonitor
+
+    monitor = LoopLagMonitor(interval_ms=10)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    window = monitor.begin(name)
+    started = time.perf_counter()
+    results = []
+    for _ in range(rounds):
+        results = await asyncio.gather(*[parse(source, html) for source, html in pages])
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    await asyncio.sleep(0.05)
+    lag = monitor.end(window)
+    await monitor.stop()
+    print(
+        f"{name:<14}{elapsed_ms:>10.0f}ms{lag['p50_ms']:>10}ms{lag['p99_ms']:>10}ms{lag['max_ms']:>10}ms"
+    )
+    return results
+
+
+async def main(args):
+    import logging
+
+    from services.parsers import PARSERS, SOURCE_KEYS
+    from services.parse_executor import run_parse, shutdown_parse_executor
+
+    logging.disable(logging.WARNING)
+
+    pages = []
+    for source in PARSERS:
+        path = os.path.join(args.fixtures, f"{SOURCE_KEYS[source].lower()}.html")
+        with open(path, encoding="utf-8") as f:
+            pages.append((source, f.read()))
+
+    async def parse_inline(source, html):
+        return PARSERS[source](html)
+
+    # 워커 프로세스 기동 비용은 측정에서 제외
+    await run_parse(*pages[0])
+
+    print(f"{'method':<14}{'total':>12}{'lag p50':>12}{'lag p99':>12}{'lag max':>12}")
+    inline = await measure("inline", pages, args.rounds, parse_inline)
+    pooled = await measure("process-pool", pages, args.rounds, run_parse)
+    shutdown_parse_executor()
+
+    if inline != pooled:
+        print("추출 결과 불일치")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--fixtures", default=os.path.join(ROOT, "scripts", "fixtures", "html")
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench_loop_lag.db")
+        asyncio.run(main(args))
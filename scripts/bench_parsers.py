@@ -0,0 +1,74 @@
+"""크롤러 HTML 파서 백엔드 벤치마크 (html.parser vs lxml)
+
+사용법: python scripts/bench_parsers.py [--fixtures scripts/fixtures/html] [--rounds 50]
+저장된 목록 페이지(<소스키>.html)를 services.parsers 의 소스별 파서로
+백엔드마다 파싱해 페이지당 소요시간을 비교하고, 추출 결과가
+html.parser 기준과 완전히 같은지 확인합니다.
+실제 페이지로 측정하려면 같은 파일명으로 저장한 HTML을 fixtures 폴더에 넣으세요.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BACKENDS = ["html.parser", "lxml"]
+
+
+def bench(parse, html: str, backend: str, rounds: int):
+    deals = parse(html, backend)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse(html, backend)
+    per_page_ms = (time.perf_counter() - started) / rounds * 1000
+    return deals, per_page_ms
+
+
+def main(args):
+    import logging
+
+    from services.parsers import PARSERS, SOURCE_KEYS
+
+    logging.disable(logging.WARNING)
+
+    print(f"{'source':<12}{'backend':<14}{'per page':>12}{'deals':>8}{'equal':>8}")
+    mismatches = 0
+    for source, parse in PARSERS.items():
+        path = os.path.join(args.fixtures, f"{SOURCE_KEYS[source].lower()}.html")
+        if not os.path.exists(path):
+            print(f"{source:<12}fixture 없음: {path}")
+            continue
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+
+        baseline = None
+        for backend in BACKENDS:
+            deals, per_page_ms = bench(parse, html, backend, args.rounds)
+            if baseline is None:
+                baseline = deals
+            equal = deals == baseline
+            mismatches += 0 if equal else 1
+            print(
+                f"{source:<12}{backend:<14}{per_page_ms:>10.2f}ms{len(deals):>8}{str(equal):>8}"
+            )
+
+    if mismatches:
+        print(f"추출 결과 불일치 {mismatches}건")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--fixtures", default=os.path.join(ROOT, "scripts", "fixtures", "html")
+    )
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench_parsers.db")
+        main(args)
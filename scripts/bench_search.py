@@ -0,0 +1,140 @@
+"""LIKE vs FTS5(trigram) 검색 지연시간 비교 벤치마크
+
+사용법: python scripts/bench_search.py [--rows 100000] [--repeat 20]
+임시 SQLite 파일에 합성 핫딜 제목을 만들고 /api/search와 같은 형태의 쿼리
+(필터 + created_at 정렬 + LIMIT 20, 별도 COUNT)를 두 방식으로 실행합니다.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+BRANDS = ["삼성", "LG", "애플", "소니", "로지텍", "샤오미", "다이슨", "나이키", "ASUS", "MSI"]
+PRODUCTS = [
+    "노트북",
+    "게이밍모니터",
+    "무선이어폰",
+    "기계식키보드",
+    "로봇청소기",
+    "공기청정기",
+    "그래픽카드 RTX 4070",
+    "SSD 1TB",
+    "에어팟 프로",
+    "런닝화",
+    "커피머신",
+    "비타민",
+]
+SUFFIXES = ["특가", "역대가", "무료배송", "카드할인", "한정수량", "리퍼", "쿠폰적용", ""]
+QUERIES = ["노트북", "RTX 4070", "에어팟", "공기청정기", "기계식키보드", "역대가", "없는상품명"]
+
+
+def build_database(path: str, rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE hotdeals (
+            id INTEGER PRIMARY KEY,
+            title VARCHAR,
+            source VARCHAR,
+            created_at DATETIME
+        )
+        """
+    )
+    conn.execute("CREATE INDEX ix_hotdeals_created ON hotdeals (created_at)")
+
+    rng = random.Random(42)
+    conn.executemany(
+        "INSERT INTO hotdeals (title, source, created_at) VALUES (?, ?, ?)",
+        (
+            (
+                f"[{rng.choice(['쿠팡', '11번가', 'G마켓'])}] {rng.choice(BRANDS)}"
+                f"{rng.choice(PRODUCTS)} {rng.randint(1, 999)}{rng.choice(SUFFIXES)}",
+                rng.choice(["뽐뿌", "루리웹", "Zod", "어미새", "퀘이사존"]),
+                f"2026-01-{1 + i * 30 // rows:02d} 00:00:{i % 60:02d}.{i:06d}",
+            )
+            for i in range(rows)
+        ),
+    )
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE deals_fts USING fts5(
+            title, content='hotdeals', content_rowid='id', tokenize='trigram'
+        )
+        """
+    )
+    conn.execute("INSERT INTO deals_fts(deals_fts) VALUES ('rebuild')")
+    conn.commit()
+    return conn
+
+
+def like_search(conn, q: str):
+    pattern = f"%{q}%"
+    total = conn.execute(
+        "SELECT COUNT(*) FROM hotdeals WHERE title LIKE ?", (pattern,)
+    ).fetchone()[0]
+    rows = conn.execute(
+        "SELECT id FROM hotdeals WHERE title LIKE ? "
+        "ORDER BY created_at DESC, id DESC LIMIT 20",
+        (pattern,),
+    ).fetchall()
+    return total, rows
+
+
+def fts_search(conn, q: str):
+    phrase = '"' + q.replace('"', '""') + '"'
+    total = conn.execute(
+        "SELECT COUNT(*) FROM deals_fts WHERE deals_fts MATCH ?", (phrase,)
+    ).fetchone()[0]
+    rows = conn.execute(
+        "SELECT h.id FROM hotdeals h "
+        "JOIN (SELECT rowid AS deal_id, bm25(deals_fts) AS rank "
+        "      FROM deals_fts WHERE deals_fts MATCH ?) m ON m.deal_id = h.id "
+        "ORDER BY m.rank, h.created_at DESC LIMIT 20",
+        (phrase,),
+    ).fetchall()
+    return total, rows
+
+
+def measure(func, conn, q: str, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(conn, q)
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        conn = build_database(os.path.join(tmp, "bench.db"), args.rows)
+        print(
+            f"합성 데이터 {args.rows:,}건 생성 + FTS rebuild: {time.perf_counter() - started:.1f}s"
+        )
+        print(f"{'query':<14}{'hits':>8}{'LIKE p50':>12}{'FTS p50':>12}{'speedup':>10}")
+
+        for q in QUERIES:
+            (like_total, _), like_samples = measure(like_search, conn, q, args.repeat)
+            (fts_total, _), fts_samples = measure(fts_search, conn, q, args.repeat)
+            like_p50 = statistics.median(like_samples)
+            fts_p50 = statistics.median(fts_samples)
+            mismatch = "" if like_total == fts_total else f"  (LIKE {like_total})"
+            print(
+                f"{q:<14}{fts_total:>8}{like_p50:>10.2f}ms{fts_p50:>10.2f}ms"
+                f"{like_p50 / max(fts_p50, 1e-6):>9.1f}x{mismatch}"
+            )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""/api/hotdeals 한 페이지(100건) 응답 직렬화 비용 벤치마크
+
+사용법: python scripts/bench_serialization.py [--deals 100] [--rounds 2000]
+임시 SQLite 파일(SQLITE_DB_PATH)에 합성 핫딜을 넣고 한 페이지를 읽어온 뒤
+다음 세 방식으로 응답 본문을 만드는 시간을 비교합니다.
+
+- to_dict+jsonable: 기존 방식 (to_dict → jsonable_encoder → json.dumps)
+- orjson: to_dict → orjson.dumps
+- fragment-memo: core.serialization.deal_list_body (딜 조각 캐시가 데워진 상태)
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def bench(name: str, rounds: int, build):
+    build()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        body = build()
+    per_page_us = (time.perf_counter() - started) / rounds * 1_000_000
+    print(f"{name:<20}{per_page_us:>12.1f}µs{len(body):>10}B")
+
+
+def main(args):
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+
+    from core.serialization import deal_list_body
+    from models import HotDeal, SessionLocal
+    from services.database import bulk_upsert_deals
+
+    deals = [
+        {
+            "thumbnail": f"https://bench.local/thumb/{i}.jpg",
+            "source": "뽐뿌",
+            "author": "bench",
+            "title": f"벤치마크 상품 {i} 무선 이어폰 특가",
+            "price": f"{(i % 300) * 1000}원",
+            "shipping": "무료배송",
+            "link": f"https://bench.local/deal/{i}",
+            "category": "기타",
+        }
+        for i in range(args.deals)
+    ]
+
+    db = SessionLocal()
+    try:
+        bulk_upsert_deals(db, deals)
+        page = db.query(HotDeal).order_by(HotDeal.id.desc()).limit(args.deals).all()
+        pagination = {"page": 1, "per_page": args.deals, "has_more": False}
+
+        print(f"{'method':<20}{'per page':>14}{'size':>11}")
+        bench(
+            "to_dict+jsonable",
+            args.rounds,
+            lambda: json.dumps(
+                jsonable_encoder(
+                    {"deals": [d.to_dict() for d in page], "pagination": pagination}
+                ),
+                ensure_ascii=False,
+            ).encode(),
+        )
+        bench(
+            "orjson",
+            args.rounds,
+            lambda: orjson.dumps(
+                {"deals": [d.to_dict() for d in page], "pagination": pagination}
+            ),
+        )
+        bench(
+            "fragment-memo",
+            args.rounds,
+            lambda: deal_list_body(page, pagination=pagination),
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--deals", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_DB_PATH"] = os.path.join(tmp, "bench_serialization.db")
+        main(args)
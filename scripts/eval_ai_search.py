@@ -0,0 +1,154 @@
+"""AI 검색 후보 검색(retrieval) 오프라인 평가
+
+사용법: GOOGLE_API_KEY=... python scripts/eval_ai_search.py [--queries scripts/ai_search_eval_queries.json]
+현재 DB와 Chroma 벡터 DB를 그대로 사용하고, 키워드 확장은 평가셋에 고정된
+keywords를 써서 LLM 호출 없이 다음 두 방식을 비교합니다.
+
+- or-join: 기존 방식 (" OR ".join(검색어+키워드) 한 문장으로 임베딩 후 top-k)
+- rrf: 원문 검색 + 키워드 일괄 임베딩/병렬 검색 → RRF → 최신성/가격 재정렬
+- hybrid: rrf에 FTS5 bm25 어휘 검색 순위 목록을 함께 합침
+
+딜 제목에 relevant_terms 중 하나라도 포함되면 정답으로 보고,
+recall@k = 정답 수 / min(k, DB 내 정답 딜 수) 를 계산합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def is_relevant(title: str, terms: list) -> bool:
+    title = (title or "").lower()
+    return any(term.lower() in title for term in terms)
+
+
+def count_relevant(db, terms: list) -> int:
+    from sqlalchemy import or_
+
+    from models import HotDeal
+
+    return (
+        db.query(HotDeal)
+        .filter(or_(*[HotDeal.title.ilike(f"%{term}%") for term in terms]))
+        .count()
+    )
+
+
+async def vector_search(vectorstore, query: str, k: int = None) -> list:
+    """질의 문자열로 Chroma 검색 (link 순위 목록 반환)"""
+    from services.ai_search import AI_SEARCH_PER_QUERY_K
+
+    results = await asyncio.to_thread(
+        vectorstore.similarity_search, query, k=k or AI_SEARCH_PER_QUERY_K
+    )
+    return [doc.metadata.get("link") for doc in results if doc.metadata.get("link")]
+
+
+async def run_or_join(vectorstore, item: dict, k: int) -> list:
+    from services.ai_search import load_ranked_deals
+    from services.db_executor import run_db
+
+    links = await vector_search(
+        vectorstore, " OR ".join([item["query"], *item["keywords"]]), k=k
+    )
+    # 기존 방식은 재정렬 없이 검색 순서 그대로 사용
+    scores = {link: 1.0 / rank for rank, link in enumerate(links, start=1)}
+    deals = await run_db(lambda db: load_ranked_deals(db, scores, limit=len(links)))
+    order = {link: rank for rank, link in enumerate(links)}
+    return sorted(deals, key=lambda deal: order[deal["link"]])[:k]
+
+
+async def run_rrf(vectorstore, item: dict, k: int) -> list:
+    from services.ai_search import (
+        load_ranked_deals,
+        reciprocal_rank_fusion,
+        search_keywords,
+    )
+    from services.db_executor import run_db
+
+    original, keyword_results = await asyncio.gather(
+        vector_search(vectorstore, item["query"]),
+        search_keywords(vectorstore, item["keywords"]),
+    )
+    scores = reciprocal_rank_fusion([original, *keyword_results])
+    return await run_db(lambda db: load_ranked_deals(db, scores, limit=k))
+
+
+async def run_hybrid(vectorstore, item: dict, k: int) -> list:
+    from services.ai_search import (
+        lexical_search,
+        load_ranked_deals,
+        reciprocal_rank_fusion,
+        search_keywords,
+    )
+    from services.db_executor import run_db
+
+    lexical, original, keyword_results = await asyncio.gather(
+        run_db(lexical_search, [item["query"], *item["keywords"]]),
+        vector_search(vectorstore, item["query"]),
+        search_keywords(vectorstore, item["keywords"]),
+    )
+    scores = reciprocal_rank_fusion([*lexical, original, *keyword_results])
+    return await run_db(lambda db: load_ranked_deals(db, scores, limit=k))
+
+
+async def main(args):
+    from models import SessionLocal
+    from services.rag import get_vectorstore
+
+    vectorstore = get_vectorstore()
+    if vectorstore is None:
+        print("GOOGLE_API_KEY가 없거나 벡터 DB를 열 수 없습니다.")
+        return
+
+    with open(args.queries, encoding="utf-8") as f:
+        items = json.load(f)
+
+    db = SessionLocal()
+    try:
+        totals = {item["query"]: count_relevant(db, item["relevant_terms"]) for item in items}
+    finally:
+        db.close()
+
+    strategies = {"or-join": run_or_join, "rrf": run_rrf, "hybrid": run_hybrid}
+    summary = {name: {"recall": [], "latency": []} for name in strategies}
+
+    print(f"{'query':<14}{'relevant':>9}" + "".join(f"{name:>16}" for name in strategies))
+    for item in items:
+        row = f"{item['query']:<14}{totals[item['query']]:>9}"
+        for name, strategy in strategies.items():
+            started = time.perf_counter()
+            deals = await strategy(vectorstore, item, args.k)
+            latency = (time.perf_counter() - started) * 1000
+
+            hits = sum(is_relevant(deal["title"], item["relevant_terms"]) for deal in deals)
+            denominator = min(args.k, totals[item["query"]])
+            recall = hits / denominator if denominator else 1.0
+            summary[name]["recall"].append(recall)
+            summary[name]["latency"].append(latency)
+            row += f"{recall:>9.2f} {latency:>5.0f}ms"
+        print(row)
+
+    print()
+    for name, values in summary.items():
+        print(
+            f"{name:<10} mean recall@{args.k} {statistics.mean(values['recall']):.3f}, "
+            f"p50 latency {statistics.median(values['latency']):.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--queries",
+        default=os.path.join(ROOT, "scripts", "ai_search_eval_queries.json"),
+    )
+    parser.add_argument("--k", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
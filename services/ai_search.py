@@ -0,0 +1,372 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+import pytz
+
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from sqlalchemy.exc import OperationalError
+
+from core.helpers import FTS_MIN_QUERY_LENGTH, make_like_pattern, make_rag_id
+from models import FTS_ENABLED, HotDeal, fts_match_subquery
+from services.cache import SemanticCache, TTLCache
+from services.database import data_generations
+from services.db_executor import run_db
+from services.rag import get_vectorstore, queue_orphan_vectors, record_query_latency
+
+logger = logging.getLogger(__name__)
+
+AI_SEARCH_MODEL = os.getenv("AI_SEARCH_MODEL", "gemini-2.0-flash")
+AI_SEARCH_TOP_K = int(os.getenv("AI_SEARCH_TOP_K", 10))
+# 검색어별 후보 수 / RRF 후 재정렬 대상 수
+AI_SEARCH_PER_QUERY_K = int(os.getenv("AI_SEARCH_PER_QUERY_K", 10))
+AI_SEARCH_CANDIDATES = int(os.getenv("AI_SEARCH_CANDIDATES", 30))
+RRF_K = int(os.getenv("RRF_K", 60))
+FRESHNESS_HALF_LIFE_HOURS = float(os.getenv("FRESHNESS_HALF_LIFE_HOURS", 72))
+PRICE_MISSING_PENALTY = 0.8
+
+# 답변 캐시는 데이터 세대별로 유효, 키워드 확장 결과는 데이터와 무관해 더 길게 보관
+AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", 1800))
+AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", 500))
+AI_CACHE_SIMILARITY = float(os.getenv("AI_CACHE_SIMILARITY", 0.95))
+AI_KEYWORD_CACHE_TTL = int(os.getenv("AI_KEYWORD_CACHE_TTL", 86400))
+
+answer_cache = SemanticCache(
+    "ai_answer",
+    max_entries=AI_CACHE_MAX_ENTRIES,
+    ttl=AI_CACHE_TTL,
+    threshold=AI_CACHE_SIMILARITY,
+)
+keyword_cache = TTLCache(
+    "ai_keywords", max_entries=AI_CACHE_MAX_ENTRIES, ttl=AI_KEYWORD_CACHE_TTL
+)
+
+KST = pytz.timezone("Asia/Seoul")
+
+EXPANSION_PROMPT = ChatPromptTemplate.from_template(
+    """사용자가 쇼핑몰에서 '{question}'(이)라고 검색했어.
+    이 의도를 만족시킬 수 있는 구체적인 상품 카테고리나 키워드 5개를 한국어로 나열해줘.
+
+    규칙:
+    1. 쉼표(,)로만 구분해.
+    2. 설명 없이 단어만 출력해.
+    3. 예시: 입력 '컴퓨터' -> 출력 '노트북,데스크탑,모니터,마우스,키보드'
+    """
+)
+
+ANSWER_PROMPT = ChatPromptTemplate.from_template(
+    """다음은 쇼핑 검색 '{query}'에 대한 결과입니다:
+    {context}
+
+    위 결과를 바탕으로 사용자에게 최적의 쇼핑 추천 답변을 한국어로 작성해주세요.
+    3-5개 추천하며, 각 추천마다 간단한 이유도 포함해주세요.
+    """
+)
+
+_chains = None
+_chains_lock = threading.Lock()
+
+
+def get_chains():
+    """LLM 클라이언트와 체인을 프로세스당 1회 생성해 재사용"""
+    global _chains
+    if _chains is None:
+        with _chains_lock:
+            if _chains is None:
+                llm = ChatGoogleGenerativeAI(
+                    model=AI_SEARCH_MODEL,
+                    temperature=0,
+                    google_api_key=os.getenv("GOOGLE_API_KEY"),
+                    transport="rest",
+                )
+                _chains = {
+                    "llm": llm,
+                    "expansion": EXPANSION_PROMPT | llm | StrOutputParser(),
+                    "answer": ANSWER_PROMPT | llm | StrOutputParser(),
+                }
+    return _chains
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def vector_search_by_vector(
+    vectorstore, vector, k: int = AI_SEARCH_PER_QUERY_K
+) -> list:
+    started = time.perf_counter()
+    results = await asyncio.to_thread(
+        vectorstore.similarity_search_by_vector, vector, k=k
+    )
+    record_query_latency((time.perf_counter() - started) * 1000)
+    return [doc.metadata.get("link") for doc in results if doc.metadata.get("link")]
+
+
+async def search_keywords(vectorstore, keywords: list) -> list:
+    """확장 키워드를 한 번에 임베딩한 뒤 키워드별 검색을 병렬 실행"""
+    if not keywords:
+        return []
+    vectors = await asyncio.to_thread(vectorstore.embeddings.embed_queries, keywords)
+    return list(
+        await asyncio.gather(
+            *[vector_search_by_vector(vectorstore, vector) for vector in vectors]
+        )
+    )
+
+
+def reciprocal_rank_fusion(ranked_lists: list, k: int = RRF_K) -> dict:
+    """여러 link 순위 목록을 RRF 점수로 합침 (link 기준 중복 제거, 점수 내림차순)"""
+    scores = {}
+    for ranked in ranked_lists:
+        for rank, link in enumerate(dict.fromkeys(ranked), start=1):
+            scores[link] = scores.get(link, 0.0) + 1.0 / (k + rank)
+    return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+
+
+def lexical_search(db, terms: list, k: int = AI_SEARCH_PER_QUERY_K) -> list:
+    """검색어별 FTS5 bm25 순위 목록 (trigram 최소 길이 미만이거나 FTS 오류 시 LIKE 최신순)"""
+    ranked_lists = []
+    for term in terms:
+        if FTS_ENABLED and len(term) >= FTS_MIN_QUERY_LENGTH:
+            matches = fts_match_subquery(term)
+            try:
+                rows = (
+                    db.query(HotDeal.link)
+                    .join(matches, matches.c.deal_id == HotDeal.id)
+                    .order_by(matches.c.rank)
+                    .limit(k)
+                    .all()
+                )
+                ranked_lists.append([row.link for row in rows])
+                continue
+            except OperationalError as e:
+                logger.warning(f"FTS 검색 실패, LIKE 검색으로 대체: {e}")
+                db.rollback()
+
+        rows = (
+            db.query(HotDeal.link)
+            .filter(HotDeal.title.like(make_like_pattern(term), escape="\\"))
+            .order_by(HotDeal.created_at.desc())
+            .limit(k)
+            .all()
+        )
+        ranked_lists.append([row.link for row in rows])
+    return ranked_lists
+
+
+async def safe_vector_search(coro, default):
+    """벡터 검색 실패(임베딩 장애 등) 시 기본값 반환 (어휘 검색만으로 계속 진행)"""
+    try:
+        return await coro
+    except Exception as e:
+        logger.warning(f"🧠 벡터 검색 실패, 어휘 검색만 사용: {e}")
+        return default
+
+
+def rerank_score(deal, score: float, now: datetime) -> float:
+    """RRF 점수에 최신성(반감기)과 가격 정보 유무 가중치 적용"""
+    age_hours = max(0.0, (now - deal.created_at).total_seconds() / 3600)
+    freshness = 0.5 ** (age_hours / FRESHNESS_HALF_LIFE_HOURS)
+    price_weight = 1.0 if deal.price_value else PRICE_MISSING_PENALTY
+    return score * (0.5 + 0.5 * freshness) * price_weight
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def parse_keywords(query: str, expanded_keywords_str: str) -> list:
+    keywords = [k.strip() for k in expanded_keywords_str.split(",") if k.strip()]
+    keywords.insert(0, query)
+    return list(dict.fromkeys(keywords))
+
+
+def load_ranked_deals(db, scores: dict, limit: int = AI_SEARCH_TOP_K) -> list:
+    """후보 link를 IN 조회 1회로 딜로 바꿔 재정렬한 상위 limit개 (없는 딜은 orphan 큐로)"""
+    candidates = list(scores.items())[:AI_SEARCH_CANDIDATES]
+    links = [link for link, _ in candidates]
+    deal_map = {
+        deal.link: deal for deal in db.query(HotDeal).filter(HotDeal.link.in_(links))
+    }
+
+    missing = [link for link in links if link not in deal_map]
+    if missing:
+        # 정리(cleanup)로 DB에서는 지워졌지만 벡터 DB에 남은 문서
+        queue_orphan_vectors(make_rag_id(link) for link in missing)
+
+    now = datetime.now(KST).replace(tzinfo=None)
+    # 후보 순서(RRF 순위)를 유지한 채 재정렬 점수 적용 (동점이면 원래 순위)
+    ranked = [
+        (rerank_score(deal_map[link], score, now), deal_map[link])
+        for link, score in candidates
+        if link in deal_map
+    ]
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [deal.to_dict() for _, deal in ranked[:limit]]
+
+
+async def expand_keywords(chains, query: str, normalized: str) -> list:
+    """LLM 키워드 확장 (정규화 검색어 기준 캐시, 실패 시 원문만)"""
+    keywords = keyword_cache.get(normalized)
+    if keywords is not None:
+        return keywords
+
+    try:
+        expanded_keywords_str = await chains["expansion"].ainvoke({"question": query})
+    except Exception as e:
+        logger.warning(f"🤖 키워드 확장 실패, 원문만 검색: {e}")
+        return [query]
+
+    keywords = parse_keywords(query, expanded_keywords_str)
+    keyword_cache.set(normalized, keywords)
+    return keywords
+
+
+async def stream_ai_search(query: str):
+    """AI 검색 파이프라인 이벤트 스트림: ("deals", ...) → ("token", ...)* → ("done", ...)
+
+    FTS5(bm25) + 벡터 검색을 RRF로 합치고, 벡터 장애 시 어휘 검색만 사용
+    """
+    timings = {}
+    total_started = time.perf_counter()
+    chains = get_chains()
+
+    # 같은 데이터 세대 안에서는 같은(또는 의미가 거의 같은) 검색어에 같은 답변
+    normalized = normalize_query(query)
+    generation = data_generations.token()
+    cache_key = f"{normalized}@{generation}"
+    cached = answer_cache.get(cache_key)
+    cache_status = "hit"
+
+    vectorstore = None
+    query_vector = None
+    if cached is None:
+        vectorstore = await asyncio.to_thread(get_vectorstore)
+        if not vectorstore:
+            logger.warning("🧠 벡터 DB 연결 실패, 어휘 검색만 사용")
+        else:
+            started = time.perf_counter()
+            query_vector = await safe_vector_search(
+                asyncio.to_thread(vectorstore.embeddings.embed_query, query), None
+            )
+            timings["embed_ms"] = _elapsed_ms(started)
+            if query_vector is not None:
+                cached = answer_cache.nearest(query_vector, generation)
+                cache_status = "semantic"
+
+    if cached is not None:
+        yield "deals", {
+            "deals": cached["deals"],
+            "expanded_keywords": cached.get("expanded_keywords", []),
+            "retrieval_mode": cached["retrieval_mode"],
+            "cache": cache_status,
+        }
+        yield "token", {"text": cached["answer"]}
+        yield "done", {**cached, "cache": cache_status}
+        return
+
+    # 원문 검색(어휘+벡터)은 키워드 확장(LLM) 응답을 기다리는 동안 먼저 실행
+    started = time.perf_counter()
+    original_tasks = [asyncio.create_task(run_db(lexical_search, [query]))]
+    if query_vector is not None:
+        original_tasks.append(
+            asyncio.create_task(
+                safe_vector_search(
+                    vector_search_by_vector(vectorstore, query_vector), []
+                )
+            )
+        )
+    keywords = await expand_keywords(chains, query, normalized)
+    timings["expansion_ms"] = _elapsed_ms(started)
+    extra_keywords = [keyword for keyword in keywords if keyword != query]
+
+    started = time.perf_counter()
+    keyword_tasks = [run_db(lexical_search, extra_keywords)]
+    if query_vector is not None:
+        keyword_tasks.append(
+            safe_vector_search(search_keywords(vectorstore, extra_keywords), [])
+        )
+    original_results = await asyncio.gather(*original_tasks)
+    keyword_results = await asyncio.gather(*keyword_tasks)
+
+    lexical_lists = original_results[0] + keyword_results[0]
+    vector_lists = []
+    if query_vector is not None:
+        vector_lists = [original_results[1], *keyword_results[1]]
+    vector_lists = [ranked for ranked in vector_lists if ranked]
+    retrieval_mode = "hybrid" if vector_lists else "lexical"
+
+    scores = reciprocal_rank_fusion(lexical_lists + vector_lists)
+    timings["retrieval_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    context_deals = await run_db(load_ranked_deals, scores)
+    timings["hydrate_ms"] = _elapsed_ms(started)
+
+    # 답변 생성 전에 딜 카드를 먼저 전송 (time-to-first-content)
+    timings["first_content_ms"] = _elapsed_ms(total_started)
+    yield "deals", {
+        "deals": context_deals,
+        "expanded_keywords": keywords,
+        "retrieval_mode": retrieval_mode,
+        "cache": "miss",
+    }
+
+    if not context_deals:
+        answer = f"'{query}' 관련 결과를 찾지 못했습니다."
+        yield "token", {"text": answer}
+    else:
+        deals_text = "\n".join(
+            [
+                f"- [{d['source']}] {d['title']} | {d['price']} | {d['shipping']}"
+                for d in context_deals
+            ]
+        )
+
+        started = time.perf_counter()
+        chunks = []
+        async for chunk in chains["answer"].astream(
+            {"query": query, "context": deals_text}
+        ):
+            if not chunk:
+                continue
+            if not chunks:
+                timings["first_token_ms"] = _elapsed_ms(total_started)
+            chunks.append(chunk)
+            yield "token", {"text": chunk}
+        answer = "".join(chunks)
+        timings["answer_ms"] = _elapsed_ms(started)
+    timings["total_ms"] = _elapsed_ms(total_started)
+
+    logger.info(
+        f"🤖 AI 검색 '{query}' ({retrieval_mode}) 단계별 소요(ms): 확장 {timings['expansion_ms']}, 검색 {timings['retrieval_ms']}, "
+        f"조회 {timings['hydrate_ms']}, 첫 콘텐츠 {timings['first_content_ms']}, "
+        f"답변 {timings.get('answer_ms', 0)}, 전체 {timings['total_ms']}"
+    )
+    result = {
+        "answer": answer,
+        "deals": context_deals,
+        "expanded_keywords": keywords,
+        "retrieval_mode": retrieval_mode,
+        "timings": timings,
+    }
+
+    # 벡터 장애로 어휘 검색만 쓴 결과는 복구 후 바로 갱신되도록 캐시하지 않음
+    if retrieval_mode == "hybrid":
+        answer_cache.set(cache_key, result, vector=query_vector, scope=generation)
+    yield "done", {**result, "cache": "miss"}
+
+
+async def run_ai_search(query: str) -> dict:
+    """스트림을 끝까지 소비해 한 번에 응답 (비스트리밍 API용)"""
+    result = {}
+    async for event, data in stream_ai_search(query):
+        if event == "done":
+            result = data
+    return result
@@ -0,0 +1,221 @@
+import asyncio
+import math
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한 LRU + 키별 TTL 캐시 (동시 miss는 조회 1회로 합침)"""
+
+    def __init__(self, name: str, max_entries: int = 1000, ttl: float = 30):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_load(self, key, loader, ttl: float = None):
+        """캐시 조회 후 miss면 loader() 실행, 같은 키의 동시 요청은 결과를 공유
+
+        loader 는 별도 태스크에서 실행하므로 먼저 요청한 쪽이 취소(클라이언트 끊김)돼도
+        합류한 다른 요청은 그대로 결과를 받는다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+        else:
+            inflight = asyncio.ensure_future(self._load(key, loader, ttl))
+            # 대기자가 모두 취소됐을 때 "exception was never retrieved" 경고 방지
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+
+    async def _load(self, key, loader, ttl: float = None):
+        try:
+            value = await loader()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+
+def _normalize_vector(vector) -> list:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """정확 일치 TTLCache + 임베딩 최근접(코사인 유사도 임계값 이상) 조회"""
+
+    def __init__(
+        self, name: str, max_entries: int = 500, ttl: float = 1800, threshold: float = 0.95
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.exact = TTLCache(name, max_entries=max_entries, ttl=ttl)
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+
+    def get(self, key):
+        return self.exact.get(key)
+
+    def nearest(self, vector, scope):
+        """같은 scope(데이터 세대) 항목 중 유사도가 가장 높은 값 (임계값 미만이면 None)"""
+        vector = _normalize_vector(vector)
+        best_key, best_score = None, self.threshold
+        with self._lock:
+            candidates = [
+                (key, stored)
+                for key, (stored_scope, stored) in self._vectors.items()
+                if stored_scope == scope
+            ]
+        for key, stored in candidates:
+            score = sum(a * b for a, b in zip(vector, stored))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        value = self.exact.get(best_key) if best_key is not None else None
+        with self._lock:
+            if value is None:
+                self.semantic_misses += 1
+                if best_key is not None:
+                    # 정확 일치 캐시에서 만료/축출된 항목
+                    self._vectors.pop(best_key, None)
+            else:
+                self.semantic_hits += 1
+        return value
+
+    def set(self, key, value, vector=None, scope=None) -> None:
+        self.exact.set(key, value)
+        if vector is None:
+            return
+        with self._lock:
+            # 이전 세대 항목은 더 이상 조회되지 않으므로 정리
+            for stale_key in [
+                k for k, (stored_scope, _) in self._vectors.items() if stored_scope != scope
+            ]:
+                del self._vectors[stale_key]
+            self._vectors[key] = (scope, _normalize_vector(vector))
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.exact.max_entries:
+                self._vectors.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.semantic_hits + self.semantic_misses
+        return {
+            **self.exact.stats(),
+            "threshold": self.threshold,
+            "vectors": len(self._vectors),
+            "semantic_hits": self.semantic_hits,
+            "semantic_misses": self.semantic_misses,
+            "semantic_hit_ratio": (
+                round(self.semantic_hits / lookups, 3) if lookups else None
+            ),
+        }
+
+
+class DataGenerations:
+    """소스/카테고리별 데이터 세대 번호 (적재 시 증가, 캐시 키에 포함해 무효화)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 프로세스 재시작 후 세대 번호가 0부터 다시 시작해도 ETag가 겹치지 않도록
+        self.epoch = secrets.token_hex(4)
+        self.current = 0
+        self.changed_at = time.time()
+        self._sources = {}
+        self._categories = {}
+
+    def bump(self, sources=(), categories=()) -> int:
+        """변경된 소스/카테고리의 세대를 새 전역 세대로 올림"""
+        sources, categories = set(sources), set(categories)
+        if not sources and not categories:
+            return self.current
+        with self._lock:
+            self.current += 1
+            self.changed_at = time.time()
+            for source in sources:
+                self._sources[source] = self.current
+            for category in categories:
+                self._categories[category] = self.current
+            return self.current
+
+    def token(self, source: str = "all", category: str = "all") -> str:
+        """필터 조합에 영향을 주는 세대만 담은 캐시 키 조각"""
+        parts = []
+        if source != "all":
+            parts.append(f"s{self._sources.get(source, 0)}")
+        if category != "all":
+            parts.append(f"c{self._categories.get(category, 0)}")
+        return ".".join(parts) if parts else f"g{self.current}"
+
+    def stats(self) -> dict:
+        return {
+            "epoch": self.epoch,
+            "current": self.current,
+            "changed_at": self.changed_at,
+            "sources": dict(self._sources),
+            "categories": dict(self._categories),
+        }
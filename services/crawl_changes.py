@@ -0,0 +1,186 @@
+import os
+import asyncio
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FIELDS = ("link", "title", "price")
+# 이미 저장된 링크가 이만큼 연달아 나오면 다음 페이지를 읽지 않음
+CRAWL_KNOWN_RUN = int(os.getenv("CRAWL_KNOWN_RUN", 5))
+
+
+def fingerprint_deals(deals: list) -> str:
+    """목록 지문 (링크 + 제목 + 가격, 순서 무관)"""
+    digest = hashlib.sha1()
+    for item in sorted(
+        tuple(str(deal.get(field, "")) for field in FINGERPRINT_FIELDS)
+        for deal in deals
+    ):
+        digest.update("\x1f".join(item).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class SourceChangeTracker:
+    """소스별 목록 페이지 변경 감지 (조건부 요청 검증자, 본문 해시, 추출 결과 지문)
+
+    검증자/지문은 DB 저장이 끝난 뒤에만 확정(commit)하므로
+    저장에 실패한 목록은 다음 크롤링에서 다시 처리된다.
+    """
+
+    def __init__(self):
+        self._committed = {}
+        self._pending = {}
+        self._stats = {}
+
+    def _stat(self, source: str) -> dict:
+        if source not in self._stats:
+            self._stats[source] = {
+                "crawls": 0,
+                "changed": 0,
+                "skipped_ingest": 0,
+                "skipped_parse": 0,
+                "not_modified": 0,
+                "skipped_deals": 0,
+            }
+        return self._stats[source]
+
+    def request_headers(self, source: str) -> dict:
+        """직전에 저장한 목록의 ETag/Last-Modified 로 조건부 요청 헤더 생성"""
+        committed = self._committed.get(source)
+        if not committed:
+            return {}
+        headers = {}
+        if committed.get("etag"):
+            headers["If-None-Match"] = committed["etag"]
+        if committed.get("last_modified"):
+            headers["If-Modified-Since"] = committed["last_modified"]
+        return headers
+
+    def observe_response(self, source: str, response) -> bool:
+        """목록 응답 기록. 304 이거나 본문이 직전과 같으면 True (파싱 생략)"""
+        committed = self._committed.get(source)
+        # 이전 크롤링이 실패하며 남긴 기록은 버림
+        self._pending.pop(source, None)
+        if response.status_code == 304 and committed:
+            self._stat(source)["not_modified"] += 1
+            self._stat(source)["skipped_parse"] += 1
+            return True
+
+        body_hash = hashlib.sha1(response.content).hexdigest()
+        if committed and committed["body_hash"] == body_hash:
+            self._stat(source)["skipped_parse"] += 1
+            return True
+
+        self._pending[source] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "body_hash": body_hash,
+        }
+        return False
+
+    def last_deals(self, source: str) -> list:
+        committed = self._committed.get(source)
+        return [dict(deal) for deal in committed["deals"]] if committed else []
+
+    def is_unchanged(self, source: str, deals: list) -> bool:
+        """직전에 저장한 목록과 지문이 같으면 True (DB 단계 생략)"""
+        stats = self._stat(source)
+        stats["crawls"] += 1
+        committed = self._committed.get(source)
+        if committed and committed["fingerprint"] == fingerprint_deals(deals):
+            stats["skipped_ingest"] += 1
+            stats["skipped_deals"] += len(deals)
+            # 항목은 같고 본문만 바뀐 경우 새 검증자/본문 해시로 갱신
+            committed.update(self._pending.pop(source, {}))
+            return True
+        stats["changed"] += 1
+        return False
+
+    def discard(self, source: str) -> None:
+        """수집에 실패한 목록의 기록 폐기 (다음 크롤링에서 다시 파싱)"""
+        self._pending.pop(source, None)
+
+    def commit(self, source: str, deals: list) -> None:
+        """DB 저장이 끝난 목록을 다음 비교 기준으로 확정 (빈 목록은 확정하지 않음)"""
+        pending = self._pending.pop(source, None)
+        if pending is None or not deals:
+            return
+        self._committed[source] = {
+            **pending,
+            "fingerprint": fingerprint_deals(deals),
+            "deals": [dict(deal) for deal in deals],
+        }
+
+    def stats(self) -> dict:
+        return {
+            source: {
+                **stats,
+                "conditional": bool(self.request_headers(source)),
+            }
+            for source, stats in self._stats.items()
+        }
+
+
+source_changes = SourceChangeTracker()
+
+
+class KnownLinks:
+    """저장된 핫딜 링크 집합 (프로세스당 1회 DB 로드, 이후 수집 결과로 갱신)
+
+    다음 페이지 크롤링 여부를 DB 조회 없이 판단하는 데 사용.
+    """
+
+    def __init__(self, known_run: int = CRAWL_KNOWN_RUN):
+        self.known_run = known_run
+        self._links = set()
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._stats = {}
+
+    async def ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            from models import HotDeal
+            from services.db_executor import run_db
+
+            links = await run_db(lambda db: [row.link for row in db.query(HotDeal.link)])
+            self._links.update(links)
+            self._loaded = True
+            logger.info(f"🔗 저장된 링크 {len(links)}개 로드 (다음 페이지 조기 종료용)")
+
+    def add(self, links) -> None:
+        self._links.update(links)
+
+    def discard(self, links) -> None:
+        self._links.difference_update(links)
+
+    def reached(self, deals: list) -> bool:
+        """페이지에서 이미 아는 링크가 known_run 개 연달아 나오면 True"""
+        run = 0
+        for deal in deals:
+            run = run + 1 if deal["link"] in self._links else 0
+            if run >= self.known_run:
+                return True
+        # 항목이 known_run 보다 적은 페이지는 전부 알던 링크일 때만 종료
+        return bool(deals) and run == len(deals)
+
+    def record_pages(self, source: str, pages: int, stop_reason: str) -> None:
+        """stop_reason: known(아는 링크 도달) / limit(최대 페이지) / end(빈 페이지·오류)"""
+        stats = self._stats.setdefault(
+            source,
+            {"crawls": 0, "pages": 0, "stopped_known": 0, "stopped_limit": 0, "stopped_end": 0},
+        )
+        stats["crawls"] += 1
+        stats["pages"] += pages
+        stats[f"stopped_{stop_reason}"] += 1
+
+    def stats(self) -> dict:
+        return {"loaded": self._loaded, "links": len(self._links), "sources": self._stats}
+
+
+known_links = KnownLinks()
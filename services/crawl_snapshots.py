@@ -0,0 +1,92 @@
+import os
+import gzip
+import json
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+import httpx
+
+from services.parsers import SOURCE_KEYS
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".html.gz"
+# 본문을 그대로 다시 내보내므로 인코딩/길이 헤더는 저장하지 않음
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def snapshot_key(url: str) -> str:
+    return hashlib.sha1(str(httpx.URL(url)).encode("utf-8")).hexdigest()[:16]
+
+
+def source_dir(snapshot_dir: str, source: str) -> str:
+    return os.path.join(snapshot_dir, SOURCE_KEYS[source].lower())
+
+
+def save_snapshot(snapshot_dir: str, source: str, url: str, response) -> str:
+    """응답 원문을 gzip 스냅샷으로 저장 (<소스>/<시각>-<URL 해시>.html.gz)"""
+    directory = source_dir(snapshot_dir, source)
+    os.makedirs(directory, exist_ok=True)
+    recorded_at = datetime.now().strftime("%Y%m%dT%H%M%S")
+    path = os.path.join(directory, f"{recorded_at}-{snapshot_key(url)}{SNAPSHOT_SUFFIX}")
+    meta = {
+        "url": url,
+        "status_code": response.status_code,
+        "headers": {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in SKIPPED_HEADERS
+        },
+        "recorded_at": recorded_at,
+    }
+    # 첫 줄은 메타 JSON, 나머지는 응답 바이트 원문
+    with gzip.open(path, "wb") as f:
+        f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n")
+        f.write(response.content)
+    return path
+
+
+def load_snapshot(path: str):
+    with gzip.open(path, "rb") as f:
+        meta_line, _, body = f.read().partition(b"\n")
+    return json.loads(meta_line), body
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """녹화된 스냅샷으로 응답하는 httpx 트랜스포트 (URL별 가장 최근 스냅샷)"""
+
+    def __init__(self, snapshot_dir: str, source: str, replay_at: Optional[str] = None):
+        self.source = source
+        self.hits = 0
+        self.misses = 0
+        self._index = {}
+
+        directory = source_dir(snapshot_dir, source)
+        names = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+        for name in names:
+            if not name.endswith(SNAPSHOT_SUFFIX):
+                continue
+            recorded_at, _, key = name[: -len(SNAPSHOT_SUFFIX)].partition("-")
+            if replay_at and recorded_at > replay_at:
+                continue
+            self._index[key] = os.path.join(directory, name)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = self._index.get(snapshot_key(str(request.url)))
+        if path is None:
+            self.misses += 1
+            raise httpx.ConnectError(
+                f"재생할 스냅샷 없음: {request.url}", request=request
+            )
+
+        self.hits += 1
+        meta, body = await asyncio.to_thread(load_snapshot, path)
+        return httpx.Response(
+            meta["status_code"], headers=meta["headers"], content=body, request=request
+        )
+
+    def stats(self) -> dict:
+        return {"snapshots": len(self._index), "hits": self.hits, "misses": self.misses}
@@ -2,18 +2,35 @@ import asyncio
 import os
 import shutil
 import logging
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List
 import pytz
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from models import HotDeal, SessionLocal, PriceHistory
 from core.helpers import parse_price_to_number
+from services.cache import TTLCache, DataGenerations
+from services.db_executor import run_db, run_in_db_thread
+from services.deal_counters import apply_counter_deltas, refresh_deal_counters
+from services.embedding_cache import prune_embedding_cache
+from services.crawl_changes import known_links, source_changes
+from services.loop_monitor import loop_lag
 
 KST = pytz.timezone("Asia/Seoul")
 logger = logging.getLogger(__name__)
 
-_hotdeals_cache = {}
-CACHE_TTL = 30
+# 캐시 키에 데이터 세대가 포함되므로 TTL은 길게 유지해도 변경이 바로 반영됨
+CACHE_TTL = int(os.getenv("CACHE_TTL", 600))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1000))
+
+response_cache = TTLCache(
+    "response", max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL
+)
+count_cache = TTLCache("count", max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+data_generations = DataGenerations()
 
 
 def backup_database():
@@ -89,16 +106,31 @@ def cleanup_old_deals():
         old_deals = db.query(HotDeal).filter(HotDeal.created_at < cutoff_naive).all()
         deleted_count = len(old_deals)
         deleted_links = [deal.link for deal in old_deals]
+        deleted_sources = {deal.source for deal in old_deals}
+        deleted_categories = {deal.category for deal in old_deals}
+        counter_deltas = Counter()
+        for deal in old_deals:
+            counter_deltas[(deal.source, deal.category)] -= 1
 
         for deal in old_deals:
             db.delete(deal)
 
+        apply_counter_deltas(db, counter_deltas)
         db.commit()
+        known_links.discard(deleted_links)
+        data_generations.bump(deleted_sources, deleted_categories)
         logger.info(f"🗑️ DB 정리 완료: {deleted_count}개 삭제")
 
     except Exception as e:
         logger.error(f"❌ DB 정리 오류: {e}")
         db.rollback()
+
+    try:
+        pruned = prune_embedding_cache(db, cutoff_naive)
+        logger.info(f"🗑️ 임베딩 캐시 정리: {pruned}개 삭제")
+    except Exception as e:
+        logger.error(f"❌ 임베딩 캐시 정리 오류: {e}")
+        db.rollback()
     finally:
         db.close()
 
@@ -119,6 +151,11 @@ def cleanup_old_deals():
             logger.error(f"❌ ChromaDB 정리 오류: {e}")
 
 
+async def run_cleanup_old_deals():
+    """스케줄러용: 정리 작업을 DB 스레드 풀에서 실행"""
+    await run_in_db_thread(cleanup_old_deals)
+
+
 async def with_retry(coro_func, max_retries: int = 3, base_delay: float = 1.0):
     """재시도 로직 헬퍼"""
     last_exception = None
@@ -153,15 +190,162 @@ def make_rag_document(deal: dict):
     )
 
 
+INGEST_CHUNK_SIZE = 500
+UPSERT_UPDATE_COLUMNS = (
+    "title",
+    "price",
+    "price_value",
+    "shipping",
+    "thumbnail",
+    "category",
+    "updated_at",
+)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def bulk_upsert_deals(db, deals: List[dict]) -> dict:
+    """크롤링 결과 일괄 저장 (IN 조회 1회 + INSERT ... ON CONFLICT 벌크 쓰기)"""
+    timings = {}
+
+    started = time.perf_counter()
+    unique_deals = {}
+    for deal in deals:
+        if deal.get("link"):
+            unique_deals[deal["link"]] = deal
+    links = list(unique_deals)
+
+    existing_map = {}
+    for i in range(0, len(links), INGEST_CHUNK_SIZE):
+        rows = (
+            db.query(
+                HotDeal.id,
+                HotDeal.link,
+                HotDeal.title,
+                HotDeal.price,
+                HotDeal.shipping,
+                HotDeal.thumbnail,
+                HotDeal.category,
+            )
+            .filter(HotDeal.link.in_(links[i : i + INGEST_CHUNK_SIZE]))
+            .all()
+        )
+        existing_map.update({row.link: row for row in rows})
+    timings["load_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    now = datetime.now(KST).replace(tzinfo=None)
+    new_rows, updated_rows, price_rows = [], [], []
+    new_deals, changed_deals, rag_deals = [], [], []
+    touched_sources, touched_categories = set(), set()
+    counter_deltas, recount_pairs = Counter(), set()
+    unchanged_count = 0
+
+    for link, deal in unique_deals.items():
+        try:
+            row = {
+                "title": deal["title"],
+                "source": deal["source"],
+                "author": deal["author"],
+                "price": deal["price"],
+                "price_value": parse_price_to_number(deal["price"]),
+                "shipping": deal["shipping"],
+                "link": link,
+                "thumbnail": deal["thumbnail"],
+                "category": deal.get("category", "기타"),
+                "created_at": now,
+                "updated_at": now,
+            }
+        except Exception as e:
+            logger.warning(f"핫딜 항목 형식 오류로 건너뜀: {link} - {e}")
+            continue
+
+        existing = existing_map.get(link)
+        if existing is None:
+            new_rows.append(row)
+            new_deals.append(deal)
+            rag_deals.append(deal)
+            counter_deltas[(row["source"], row["category"])] += 1
+            touched_sources.add(row["source"])
+            touched_categories.add(row["category"])
+            continue
+
+        price_changed = existing.price != row["price"]
+        changed = (
+            existing.title != row["title"]
+            or price_changed
+            or existing.shipping != row["shipping"]
+            or existing.thumbnail != row["thumbnail"]
+            or existing.category != row["category"]
+        )
+        if not changed:
+            unchanged_count += 1
+            continue
+
+        updated_rows.append(row)
+        changed_deals.append(deal)
+        # RAG 문서(page_content)는 제목/가격만 포함하므로 그 외 변경은 재임베딩 불필요
+        if price_changed or existing.title != row["title"]:
+            rag_deals.append(deal)
+        touched_sources.add(row["source"])
+        touched_categories.update((row["category"], existing.category))
+        if existing.category != row["category"]:
+            recount_pairs.update(
+                {(row["source"], existing.category), (row["source"], row["category"])}
+            )
+
+        if price_changed:
+            price_rows.append(
+                {
+                    "deal_id": existing.id,
+                    "price": row["price"],
+                    "price_value": row["price_value"],
+                    "recorded_at": now,
+                }
+            )
+            logger.info(
+                f"💰 가격 변동 기록: {existing.title[:30]}... {existing.price} -> {row['price']}"
+            )
+    timings["diff_ms"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    rows_to_write = new_rows + updated_rows
+    if rows_to_write:
+        stmt = sqlite_insert(HotDeal.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HotDeal.link],
+            set_={col: stmt.excluded[col] for col in UPSERT_UPDATE_COLUMNS},
+        )
+        db.execute(stmt, rows_to_write)
+    if price_rows:
+        db.execute(insert(PriceHistory.__table__), price_rows)
+    apply_counter_deltas(
+        db, counter_deltas, newest={pair: now for pair in counter_deltas}
+    )
+    # 카테고리가 바뀐 딜은 기존 조합의 최신 시각도 달라질 수 있어 해당 조합만 재집계
+    refresh_deal_counters(db, recount_pairs)
+    db.commit()
+    timings["write_ms"] = _elapsed_ms(started)
+
+    return {
+        "new": len(new_rows),
+        "updated": len(updated_rows),
+        "unchanged": unchanged_count,
+        "price_changes": len(price_rows),
+        "new_deals": new_deals,
+        "changed_deals": changed_deals,
+        "rag_deals": rag_deals,
+        "touched_sources": touched_sources,
+        "touched_categories": touched_categories,
+        "timings": timings,
+    }
+
+
 async def crawl_and_save_to_db():
     """전체 크롤링 및 DB 저장"""
-    from services.scraper import (
-        scrape_ppomppu,
-        scrape_quasarzone,
-        scrape_ruliweb,
-        scrape_eomisae,
-        scrape_zod,
-    )
+    from services.scraper import SCRAPERS
     from services.rag import upsert_rag_documents, get_vectorstore
 
     logger.info(
@@ -171,103 +355,88 @@ async def crawl_and_save_to_db():
     all_deals = []
 
     logger.info("--- 크롤러 5개 병렬 시작 ---")
+    crawl_started = time.perf_counter()
+    lag_window = loop_lag.begin("crawl")
+    sources = ["뽐뿌", "퀘이사존", "루리웹", "어미새", "Zod"]
     tasks = [
-        with_retry(scrape_ppomppu, max_retries=3, base_delay=2.0),
-        with_retry(scrape_quasarzone, max_retries=3, base_delay=2.0),
-        with_retry(scrape_ruliweb, max_retries=3, base_delay=2.0),
-        with_retry(scrape_eomisae, max_retries=3, base_delay=2.0),
-        with_retry(scrape_zod, max_retries=3, base_delay=2.0),
+        with_retry(SCRAPERS[source], max_retries=3, base_delay=2.0)
+        for source in sources
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    for result in results:
+    changed_results = {}
+    skipped_sources = []
+    for source, result in zip(sources, results):
         if isinstance(result, Exception):
             logger.error(f"크롤링 오류: {result}")
+            source_changes.discard(source)
+        elif not result:
+            # 빈 목록(수집 실패 포함)은 변경 감지 기준으로 확정하지 않음
+            source_changes.discard(source)
+        elif source_changes.is_unchanged(source, result):
+            skipped_sources.append(source)
         else:
+            changed_results[source] = result
             all_deals.extend(result)
-    logger.info("--- 크롤러 5개 완료 ---")
+    crawl_ms = _elapsed_ms(crawl_started)
+    crawl_lag = loop_lag.end(lag_window)
+    if crawl_lag["samples"]:
+        logger.info(
+            f"--- 크롤러 5개 완료 ({crawl_ms}ms, 이벤트 루프 지연 "
+            f"p99 {crawl_lag['p99_ms']}ms / 최대 {crawl_lag['max_ms']}ms) ---"
+        )
+    else:
+        logger.info(f"--- 크롤러 5개 완료 ({crawl_ms}ms) ---")
+
+    if skipped_sources:
+        logger.info(f"🔁 목록 변경 없는 소스 저장 생략: {skipped_sources}")
 
     if not all_deals:
         return
 
-    db = SessionLocal()
-    new_count = 0
-    duplicate_count = 0
-
-    deals_for_rag = []
-
     try:
-        for deal in all_deals:
-            try:
-                existing = (
-                    db.query(HotDeal).filter(HotDeal.link == deal["link"]).first()
-                )
-
-                if existing:
-                    price_changed = existing.price != deal["price"]
-                    changed = (
-                        existing.title != deal["title"]
-                        or price_changed
-                        or existing.shipping != deal["shipping"]
-                        or existing.thumbnail != deal["thumbnail"]
-                        or existing.category != deal.get("category", "기타")
-                    )
-                    existing.title = deal["title"]
-                    existing.price = deal["price"]
-                    existing.price_value = parse_price_to_number(deal["price"])
-                    existing.shipping = deal["shipping"]
-                    existing.thumbnail = deal["thumbnail"]
-                    existing.category = deal.get("category", "기타")
-                    duplicate_count += 1
-
-                    if price_changed:
-                        price_history = PriceHistory(
-                            deal_id=existing.id,
-                            price=deal["price"],
-                            price_value=parse_price_to_number(deal["price"]),
-                            recorded_at=datetime.now(KST).replace(tzinfo=None),
-                        )
-                        db.add(price_history)
-                        logger.info(
-                            f"💰 가격 변동 기록: {existing.title[:30]}... {existing.price} -> {deal['price']}"
-                        )
-
-                    if changed:
-                        deals_for_rag.append(make_rag_document(deal))
-                else:
-                    deal["price_value"] = parse_price_to_number(deal["price"])
-                    db_deal = HotDeal(
-                        **deal, created_at=datetime.now(KST).replace(tzinfo=None)
-                    )
-                    db.add(db_deal)
-                    new_count += 1
-                    deals_for_rag.append(make_rag_document(deal))
+        result = await run_db(bulk_upsert_deals, all_deals)
+        # 커밋 직후 목록/검색 캐시 무효화 (RAG·통계 작업 전)
+        generation = data_generations.bump(
+            result["touched_sources"], result["touched_categories"]
+        )
+        logger.info(
+            f"🔄 캐시 세대 갱신: {generation} (소스 {sorted(result['touched_sources'])})"
+        )
+        for source, deals in changed_results.items():
+            source_changes.commit(source, deals)
+        known_links.add(deal["link"] for deal in all_deals)
+        new_count = result["new"]
+        timings = {"crawl_ms": crawl_ms, **result["timings"]}
 
-                db.flush()
-            except Exception:
-                continue
-
-        db.commit()
+        deals_for_rag = [make_rag_document(deal) for deal in result["rag_deals"]]
 
+        rag_started = time.perf_counter()
         GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
         if deals_for_rag and GOOGLE_API_KEY:
             try:
-                vectorstore = get_vectorstore()
+                vectorstore = await asyncio.to_thread(get_vectorstore)
                 if vectorstore:
-                    upsert_rag_documents(vectorstore, deals_for_rag)
+                    rag_counts = await asyncio.to_thread(
+                        upsert_rag_documents, vectorstore, deals_for_rag
+                    )
                     logger.info(
-                        f"🧠 RAG: 핫딜 {len(deals_for_rag)}개를 Gemini 기억장치에 동기화했습니다."
+                        f"🧠 RAG: 핫딜 {len(deals_for_rag)}개를 Gemini 기억장치에 동기화했습니다. "
+                        f"(추가 {rag_counts['added']}, 갱신 {rag_counts['updated']}, 변경없음 {rag_counts['unchanged']})"
                     )
             except Exception as rag_error:
                 logger.error(f"🧠 RAG 저장 실패: {rag_error}")
+        timings["rag_ms"] = _elapsed_ms(rag_started)
 
-        total_count = db.query(HotDeal).count()
-        logger.info(f"✅ DB 저장 완료: 신규 {new_count}, 전체 {total_count}")
-        if new_count > 0:
-            _hotdeals_cache.clear()
+        total_count = await run_db(lambda db: db.query(HotDeal).count())
+        logger.info(
+            f"✅ DB 저장 완료: 신규 {new_count}, 갱신 {result['updated']}, "
+            f"변경없음 {result['unchanged']}, 가격변동 {result['price_changes']}, 전체 {total_count}"
+        )
+        logger.info(
+            f"⏱️ 단계별 소요(ms): 크롤링 {timings['crawl_ms']}, 조회 {timings['load_ms']}, 비교 {timings['diff_ms']}, "
+            f"쓰기 {timings['write_ms']}, RAG {timings['rag_ms']}"
+        )
 
     except Exception as e:
         logger.error(f"❌ DB 저장 오류: {e}")
-        db.rollback()
-    finally:
-        db.close()
@@ -0,0 +1,39 @@
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from models import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", 4))
+
+_db_executor = ThreadPoolExecutor(
+    max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db"
+)
+
+
+async def run_in_db_thread(func, *args, **kwargs):
+    """동기 함수를 DB 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, partial(func, *args, **kwargs))
+
+
+def _with_session(func, *args, **kwargs):
+    db = SessionLocal()
+    try:
+        return func(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def run_db(func, *args, **kwargs):
+    """func(db, *args, **kwargs)를 새 세션과 함께 DB 스레드에서 실행"""
+    return await run_in_db_thread(_with_session, func, *args, **kwargs)
+
+
+def shutdown_db_executor() -> None:
+    _db_executor.shutdown(wait=True)
+    logger.info("🛑 DB 스레드 풀 종료")
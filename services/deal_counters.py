@@ -0,0 +1,134 @@
+import logging
+from collections import Counter
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import Category, DealCounter, HotDeal
+
+logger = logging.getLogger(__name__)
+
+
+def apply_counter_deltas(db, deltas: Counter, newest: dict = None) -> None:
+    """(source, category)별 증감분과 최신 created_at을 deal_counters에 반영 (commit은 호출자)"""
+    newest = newest or {}
+    rows = [
+        {
+            "source": source,
+            "category": category,
+            "count": delta,
+            "newest_created_at": newest.get((source, category)),
+        }
+        for (source, category), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = sqlite_insert(DealCounter.__table__)
+    excluded_newest = stmt.excluded.newest_created_at
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DealCounter.source, DealCounter.category],
+        set_={
+            "count": DealCounter.count + stmt.excluded.count,
+            # SQLite의 2인자 max()는 NULL이 섞이면 NULL이므로 양쪽을 coalesce
+            "newest_created_at": func.max(
+                func.coalesce(DealCounter.newest_created_at, excluded_newest),
+                func.coalesce(excluded_newest, DealCounter.newest_created_at),
+            ),
+        },
+    )
+    db.execute(stmt, rows)
+    db.execute(delete(DealCounter).where(DealCounter.count <= 0))
+
+
+def refresh_deal_counters(db, pairs) -> None:
+    """지정한 (source, category) 조합만 hotdeals에서 다시 집계 (commit은 호출자)"""
+    pairs = {pair for pair in pairs if pair[0] and pair[1]}
+    if not pairs:
+        return
+
+    db.execute(
+        delete(DealCounter).where(
+            tuple_(DealCounter.source, DealCounter.category).in_(pairs)
+        )
+    )
+    rows = (
+        db.query(
+            HotDeal.source,
+            HotDeal.category,
+            func.count(HotDeal.id),
+            func.max(HotDeal.created_at),
+        )
+        .filter(tuple_(HotDeal.source, HotDeal.category).in_(pairs))
+        .group_by(HotDeal.source, HotDeal.category)
+        .all()
+    )
+    if rows:
+        db.execute(
+            sqlite_insert(DealCounter.__table__),
+            [
+                {
+                    "source": source,
+                    "category": category,
+                    "count": count,
+                    "newest_created_at": newest_created_at,
+                }
+                for source, category, count, newest_created_at in rows
+            ],
+        )
+
+
+def rebuild_deal_counters(db) -> int:
+    """hotdeals 전체를 GROUP BY 한 번으로 재집계 (서버 시작 시 드리프트 보정)"""
+    db.execute(delete(DealCounter))
+    db.execute(
+        sqlite_insert(DealCounter.__table__).from_select(
+            ["source", "category", "count", "newest_created_at"],
+            select(
+                HotDeal.source,
+                HotDeal.category,
+                func.count(HotDeal.id),
+                func.max(HotDeal.created_at),
+            )
+            .where(HotDeal.source.is_not(None), HotDeal.category.is_not(None))
+            .group_by(HotDeal.source, HotDeal.category),
+        )
+    )
+    db.commit()
+    total = db.query(func.coalesce(func.sum(DealCounter.count), 0)).scalar()
+    logger.info(f"📊 딜 집계 테이블 재구성: {total}개")
+    return total
+
+
+def _format_datetime(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else None
+
+
+def load_deal_summary(db) -> dict:
+    """deal_counters 한 번 조회로 전체/소스별/카테고리별 집계와 소스별 최신 시각 반환"""
+    total = 0
+    by_source, by_category = {}, {c.value: 0 for c in Category}
+    newest_by_source = {}
+
+    for counter in db.query(DealCounter).all():
+        total += counter.count
+        by_source[counter.source] = by_source.get(counter.source, 0) + counter.count
+        by_category[counter.category] = (
+            by_category.get(counter.category, 0) + counter.count
+        )
+        newest = newest_by_source.get(counter.source)
+        if counter.newest_created_at and (
+            newest is None or counter.newest_created_at > newest
+        ):
+            newest_by_source[counter.source] = counter.newest_created_at
+
+    return {
+        "total": total,
+        "by_source": by_source,
+        "by_category": by_category,
+        "freshness": {
+            source: _format_datetime(newest_by_source.get(source))
+            for source in by_source
+        },
+    }
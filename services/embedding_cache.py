@@ -0,0 +1,162 @@
+import logging
+import threading
+from array import array
+from datetime import datetime
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from core.helpers import make_content_hash
+from models import KST, EmbeddingCache, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_CHUNK_SIZE = 500
+
+
+def _pack(vector) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    return array("f", blob).tolist()
+
+
+def _now():
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+def prune_embedding_cache(db, cutoff) -> int:
+    """cutoff 이후 한 번도 쓰이지 않은 임베딩 캐시 삭제 (정리 대상 딜과 같은 보관 기간)"""
+    deleted = (
+        db.query(EmbeddingCache)
+        .filter(EmbeddingCache.last_used_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+class CachedEmbeddings(Embeddings):
+    """문서 임베딩을 page_content 해시로 캐시 (처음 보는 문장만 API 호출)"""
+
+    def __init__(self, embeddings: Embeddings, model: str):
+        self.embeddings = embeddings
+        self.model = model
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.api_calls = 0
+
+    def _load(self, hashes: List[str]) -> dict:
+        cached = {}
+        db = SessionLocal()
+        try:
+            for i in range(0, len(hashes), EMBEDDING_CACHE_CHUNK_SIZE):
+                rows = (
+                    db.query(EmbeddingCache.content_hash, EmbeddingCache.vector)
+                    .filter(
+                        EmbeddingCache.model == self.model,
+                        EmbeddingCache.content_hash.in_(
+                            hashes[i : i + EMBEDDING_CACHE_CHUNK_SIZE]
+                        ),
+                    )
+                    .all()
+                )
+                cached.update({row.content_hash: _unpack(row.vector) for row in rows})
+        finally:
+            db.close()
+        return cached
+
+    def _touch(self, hashes: List[str]) -> None:
+        """캐시 적중 항목의 last_used_at 갱신 (쓰이는 벡터가 정리되지 않도록)"""
+        now = _now()
+        db = SessionLocal()
+        try:
+            for i in range(0, len(hashes), EMBEDDING_CACHE_CHUNK_SIZE):
+                db.query(EmbeddingCache).filter(
+                    EmbeddingCache.model == self.model,
+                    EmbeddingCache.content_hash.in_(
+                        hashes[i : i + EMBEDDING_CACHE_CHUNK_SIZE]
+                    ),
+                ).update({"last_used_at": now}, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"임베딩 캐시 사용 시각 갱신 실패: {e}")
+        finally:
+            db.close()
+
+    def _save(self, vectors: dict) -> None:
+        now = _now()
+        rows = [
+            {
+                "content_hash": content_hash,
+                "model": self.model,
+                "dimensions": len(vector),
+                "vector": _pack(vector),
+                "last_used_at": now,
+            }
+            for content_hash, vector in vectors.items()
+        ]
+        stmt = sqlite_insert(EmbeddingCache.__table__)
+        # 다른 작업이 먼저 저장한 항목은 벡터는 두고 사용 시각만 갱신
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["content_hash", "model"],
+            set_={"last_used_at": stmt.excluded.last_used_at},
+        )
+        db = SessionLocal()
+        try:
+            for i in range(0, len(rows), EMBEDDING_CACHE_CHUNK_SIZE):
+                db.execute(stmt, rows[i : i + EMBEDDING_CACHE_CHUNK_SIZE])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"임베딩 캐시 저장 실패: {e}")
+        finally:
+            db.close()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [make_content_hash(text) for text in texts]
+        cached = self._load(list(set(hashes)))
+        if cached:
+            self._touch(list(cached))
+
+        missing = {}
+        for content_hash, text in zip(hashes, texts):
+            if content_hash not in cached:
+                missing[content_hash] = text
+
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            fresh = dict(zip(missing, vectors))
+            self._save(fresh)
+            cached.update(fresh)
+
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+            self.api_calls += 1 if missing else 0
+        return [cached[content_hash] for content_hash in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        # 검색어는 RETRIEVAL_QUERY 태스크로 임베딩되어 문서 캐시와 섞지 않음
+        return self.embeddings.embed_query(text)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """검색어 여러 개를 한 번의 API 호출로 임베딩"""
+        try:
+            return self.embeddings.embed_documents(texts, task_type="RETRIEVAL_QUERY")
+        except TypeError:
+            return [self.embeddings.embed_query(text) for text in texts]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "api_calls": self.api_calls,
+        }
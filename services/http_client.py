@@ -0,0 +1,210 @@
+import os
+import asyncio
+import logging
+import weakref
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_HTTP2 = os.getenv("SCRAPER_HTTP2", "false").lower() == "true"
+SCRAPER_MAX_CONNECTIONS_PER_HOST = int(
+    os.getenv("SCRAPER_MAX_CONNECTIONS_PER_HOST", 6)
+)
+SCRAPER_KEEPALIVE_EXPIRY = float(os.getenv("SCRAPER_KEEPALIVE_EXPIRY", 120))
+# 크롤링 응답 녹화/재생 (오프라인 테스트·벤치마크용)
+CRAWL_RECORD_DIR = os.getenv("CRAWL_RECORD_DIR")
+CRAWL_REPLAY_DIR = os.getenv("CRAWL_REPLAY_DIR")
+CRAWL_REPLAY_AT = os.getenv("CRAWL_REPLAY_AT")
+
+CHROME_MAC_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+CHROME_WINDOWS_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 소스별 기본 헤더/타임아웃 프로필 (소스 = 한 호스트)
+SOURCE_PROFILES = {
+    "뽐뿌": {
+        "headers": {"User-Agent": "Mozilla/5.0"},
+        "timeout": 10.0,
+    },
+    "루리웹": {
+        "headers": {
+            "User-Agent": CHROME_MAC_USER_AGENT,
+            "Accept-Language": "ko-KR,ko;q=0.9",
+        },
+        "timeout": 15.0,
+        "follow_redirects": True,
+    },
+    "Zod": {
+        "headers": {
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        },
+        "timeout": 15.0,
+        "impersonate": "chrome120",
+    },
+    "퀘이사존": {
+        "headers": {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            "Referer": "https://quasarzone.com",
+        },
+        "timeout": 15.0,
+    },
+    "어미새": {
+        "headers": {
+            "User-Agent": CHROME_WINDOWS_USER_AGENT,
+            "Accept-Language": "ko-KR,ko;q=0.9",
+        },
+        "timeout": 20.0,
+        "follow_redirects": True,
+    },
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+class HttpClientRegistry:
+    """크롤러 공용 HTTP 클라이언트 (소스별 keep-alive 커넥션 풀 재사용)"""
+
+    def __init__(self):
+        self._clients = {}
+        self._stats = {}
+        self._seen_streams = {}
+        self.http2 = SCRAPER_HTTP2 and _http2_available()
+        if SCRAPER_HTTP2 and not self.http2:
+            logger.warning("SCRAPER_HTTP2=true 이지만 h2 패키지가 없어 HTTP/1.1로 동작합니다")
+        self.record_dir = CRAWL_RECORD_DIR
+        self.replay_dir = CRAWL_REPLAY_DIR
+        self._recorded = {}
+
+    def _create_client(self, source: str):
+        profile = SOURCE_PROFILES[source]
+
+        if self.replay_dir:
+            from services.crawl_snapshots import ReplayTransport
+
+            return httpx.AsyncClient(
+                headers=profile["headers"],
+                follow_redirects=profile.get("follow_redirects", False),
+                transport=ReplayTransport(self.replay_dir, source, CRAWL_REPLAY_AT),
+            )
+
+        if profile.get("impersonate"):
+            # TLS 핑거프린트 우회가 필요한 소스는 curl_cffi 세션 사용
+            from curl_cffi.requests import AsyncSession
+
+            return AsyncSession(
+                impersonate=profile["impersonate"],
+                headers=profile["headers"],
+                max_clients=SCRAPER_MAX_CONNECTIONS_PER_HOST,
+            )
+
+        return httpx.AsyncClient(
+            headers=profile["headers"],
+            follow_redirects=profile.get("follow_redirects", False),
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=SCRAPER_MAX_CONNECTIONS_PER_HOST,
+                max_keepalive_connections=SCRAPER_MAX_CONNECTIONS_PER_HOST,
+                keepalive_expiry=SCRAPER_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    def client(self, source: str):
+        if source not in self._clients:
+            self._clients[source] = self._create_client(source)
+            self._stats[source] = {"requests": 0, "new_connections": 0, "errors": 0}
+            self._seen_streams[source] = weakref.WeakSet()
+        return self._clients[source]
+
+    def open(self) -> None:
+        """앱 시작 시 모든 소스 클라이언트 생성"""
+        for source in SOURCE_PROFILES:
+            self.client(source)
+        logger.info(
+            f"🌐 크롤러 HTTP 클라이언트 준비: {len(self._clients)}개 소스, "
+            f"호스트당 최대 {SCRAPER_MAX_CONNECTIONS_PER_HOST} 연결, http2={self.http2}"
+        )
+        if self.replay_dir:
+            logger.info(f"📼 크롤링 재생 모드: {self.replay_dir} 스냅샷으로 응답")
+        elif self.record_dir:
+            logger.info(f"📼 크롤링 녹화 모드: {self.record_dir} 에 응답 저장")
+
+    async def aclose(self) -> None:
+        """앱 종료 시 커넥션 풀 정리"""
+        for source, client in list(self._clients.items()):
+            try:
+                if isinstance(client, httpx.AsyncClient):
+                    await client.aclose()
+                else:
+                    await client.close()
+            except Exception as e:
+                logger.warning(f"{source} HTTP 클라이언트 종료 오류: {e}")
+        self._clients.clear()
+
+    async def get(self, source: str, url: str, **kwargs):
+        """소스 프로필(헤더/타임아웃)을 적용한 GET 요청"""
+        client = self.client(source)
+        kwargs.setdefault("timeout", SOURCE_PROFILES[source]["timeout"])
+        stats = self._stats[source]
+        stats["requests"] += 1
+        try:
+            response = await client.get(url, **kwargs)
+        except Exception:
+            stats["errors"] += 1
+            raise
+
+        stream = getattr(response, "extensions", {}).get("network_stream")
+        if stream is not None and stream not in self._seen_streams[source]:
+            self._seen_streams[source].add(stream)
+            stats["new_connections"] += 1
+
+        if self.record_dir and not self.replay_dir:
+            await self._record(source, url, response)
+        return response
+
+    async def _record(self, source: str, url: str, response) -> None:
+        from services.crawl_snapshots import save_snapshot
+
+        try:
+            await asyncio.to_thread(
+                save_snapshot, self.record_dir, source, url, response
+            )
+            self._recorded[source] = self._recorded.get(source, 0) + 1
+        except Exception as e:
+            logger.warning(f"{source} 응답 녹화 실패: {url} - {e}")
+
+    def _open_connections(self, client) -> Optional[int]:
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        if pool is None:
+            return None
+        return sum(1 for conn in pool.connections if not conn.is_closed())
+
+    def stats(self) -> dict:
+        """소스별 커넥션 풀 통계 (열린 연결 수, 재사용률)"""
+        result = {}
+        for source, client in self._clients.items():
+            stats = self._stats[source]
+            requests = stats["requests"] - stats["errors"]
+            is_httpx = isinstance(client, httpx.AsyncClient)
+            result[source] = {
+                **stats,
+                "recorded": self._recorded.get(source, 0),
+                "open_connections": self._open_connections(client),
+                "reuse_ratio": round(1 - stats["new_connections"] / requests, 3)
+                if is_httpx and requests > 0
+                else None,
+            }
+            if self.replay_dir:
+                result[source]["replay"] = client._transport.stats()
+        return result
+
+
+http_clients = HttpClientRegistry()
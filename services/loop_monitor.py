@@ -0,0 +1,91 @@
+import os
+import asyncio
+import itertools
+import logging
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_INTERVAL_MS = int(os.getenv("LOOP_LAG_INTERVAL_MS", 100))
+LOOP_LAG_SAMPLES = int(os.getenv("LOOP_LAG_SAMPLES", 600))
+
+
+def _percentile(values, ratio: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def _summary(values) -> dict:
+    return {
+        "samples": len(values),
+        "p50_ms": _percentile(values, 0.5),
+        "p99_ms": _percentile(values, 0.99),
+        "max_ms": max(values) if values else None,
+    }
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 (주기적으로 깨어나 예정 시각보다 늦은 만큼 기록)"""
+
+    def __init__(self, interval_ms: int = LOOP_LAG_INTERVAL_MS):
+        self.interval = interval_ms / 1000
+        self._recent = deque(maxlen=LOOP_LAG_SAMPLES)
+        self._windows = {}
+        self._last_windows = {}
+        self._window_ids = itertools.count(1)
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, (loop.time() - expected) * 1000))
+
+    def record(self, lag_ms: float) -> None:
+        lag_ms = round(lag_ms, 1)
+        self._recent.append(lag_ms)
+        for samples in self._windows.values():
+            samples.append(lag_ms)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def begin(self, name: str) -> tuple:
+        """구간 측정 시작 (예: 크롤링 중 지연). end() 에 넘길 구간 키 반환
+
+        같은 이름의 구간이 겹쳐도 서로의 샘플을 덮어쓰지 않도록 호출마다 키를 새로 발급.
+        """
+        window = (name, next(self._window_ids))
+        self._windows[window] = []
+        return window
+
+    def end(self, window: tuple) -> dict:
+        """구간 측정 종료 후 요약 반환 (이름별 마지막 요약은 stats 에 노출)"""
+        summary = _summary(self._windows.pop(window, []))
+        self._last_windows[window[0]] = summary
+        return summary
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "interval_ms": self.interval * 1000,
+            "recent": _summary(list(self._recent)),
+            "windows": dict(self._last_windows),
+        }
+
+
+loop_lag = LoopLagMonitor()
@@ -0,0 +1,93 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from services.parsers import DEAL_FIELDS, parse_compact, parse_og_image
+
+logger = logging.getLogger(__name__)
+
+# 0 이면 프로세스 풀 없이 스레드에서 파싱
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", 2))
+
+_parse_executor = None
+_parse_lock = threading.Lock()
+_parse_stats = {"jobs": 0, "thread_jobs": 0, "restarts": 0}
+
+
+def _init_worker() -> None:
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s %(name)s [parse] %(message)s"
+    )
+
+
+def _get_executor():
+    global _parse_executor
+    if PARSE_WORKERS <= 0:
+        return None
+    with _parse_lock:
+        if _parse_executor is None:
+            # 스케줄러/DB 스레드가 도는 프로세스라 fork 대신 spawn 사용
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info(f"🧩 파싱 프로세스 풀 시작: {PARSE_WORKERS}개 워커")
+        return _parse_executor
+
+
+def _discard_executor(executor) -> None:
+    global _parse_executor
+    with _parse_lock:
+        if _parse_executor is executor:
+            _parse_executor = None
+            _parse_stats["restarts"] += 1
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_parse_job(func, *args):
+    executor = _get_executor()
+    _parse_stats["jobs"] += 1
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            logger.error("🧩 파싱 워커 비정상 종료: 풀 재생성 후 이번 작업은 스레드에서 처리")
+            _discard_executor(executor)
+
+    _parse_stats["thread_jobs"] += 1
+    return await asyncio.to_thread(func, *args)
+
+
+async def run_parse(source: str, html: str) -> list:
+    """목록 페이지를 파싱 워커에서 처리 (이벤트 루프 GIL 점유 방지)"""
+    rows = await _run_parse_job(parse_compact, source, html)
+    return [dict(zip(DEAL_FIELDS, row)) for row in rows]
+
+
+async def run_parse_og_image(source: str, html: str) -> str:
+    """상세 페이지 og:image 추출을 파싱 워커에서 처리"""
+    return await _run_parse_job(parse_og_image, source, html)
+
+
+def start_parse_executor() -> None:
+    """앱 시작 시 파싱 프로세스 풀 생성"""
+    _get_executor()
+
+
+def shutdown_parse_executor() -> None:
+    global _parse_executor
+    with _parse_lock:
+        executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("🛑 파싱 프로세스 풀 종료")
+
+
+def parse_executor_stats() -> dict:
+    return {"workers": PARSE_WORKERS, "running": _parse_executor is not None, **_parse_stats}
@@ -0,0 +1,418 @@
+import os
+import re
+import logging
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from core.helpers import clean_deal_title, parse_price_to_number
+from core.categories import classify_category
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml")
+SOURCE_KEYS = {
+    "뽐뿌": "PPOMPPU",
+    "루리웹": "RULIWEB",
+    "Zod": "ZOD",
+    "퀘이사존": "QUASARZONE",
+    "어미새": "EOMISAE",
+}
+# 프로세스 간 전달용 튜플 필드 순서
+DEAL_FIELDS = (
+    "thumbnail",
+    "source",
+    "author",
+    "title",
+    "price",
+    "shipping",
+    "link",
+    "category",
+)
+# 가격/배송 표시가 아닌 퀘이사존 메타 span
+QUASARZONE_META_CLASSES = {"category", "text-orange", "nick", "count", "date"}
+
+
+def _lxml_available() -> bool:
+    try:
+        import lxml  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _resolve_parser(name: str) -> str:
+    if name == "lxml" and not _lxml_available():
+        logger.warning("HTML_PARSER=lxml 이지만 lxml 패키지가 없어 html.parser로 동작합니다")
+        return "html.parser"
+    return name
+
+
+# 소스별 파서 백엔드 (HTML_PARSER_<SOURCE>=html.parser 로 개별 지정)
+SOURCE_PARSERS = {
+    source: _resolve_parser(os.getenv(f"HTML_PARSER_{key}", HTML_PARSER))
+    for source, key in SOURCE_KEYS.items()
+}
+
+
+def make_soup(source: str, html: str, parser: str = None, parse_only=None):
+    """소스에 지정된 파서 백엔드로 HTML 파싱"""
+    return BeautifulSoup(
+        html, parser or SOURCE_PARSERS[source], parse_only=parse_only
+    )
+
+
+def _absolute_url(src: str, base: str) -> str:
+    if src.startswith("//"):
+        return "https:" + src
+    if src.startswith("http"):
+        return src
+    if src.startswith("/"):
+        return base + src
+    return ""
+
+
+def parse_ppomppu(html: str, parser: str = None) -> list:
+    soup = make_soup("뽐뿌", html, parser)
+    deal_list = []
+    base_url = "https://www.ppomppu.co.kr/zboard/"
+    main_table = soup.find("table", id="revolution_main_table")
+    if not main_table:
+        return []
+
+    for item in main_table.find_all("tr", class_="baseList"):
+        try:
+            title_cell = item.find("td", class_="title")
+            author_cell = item.find("span", "baseList-name")
+            if not (title_cell and author_cell):
+                continue
+            title_tag = title_cell.find("a", class_="baseList-title")
+            if title_tag and "id=ppomppu" in title_tag["href"]:
+                full_title = title_tag.get_text(strip=True)
+                link = (
+                    base_url + title_tag["href"]
+                    if title_tag["href"].startswith("view.php")
+                    else title_tag["href"]
+                )
+                thumbnail_tag = title_cell.find("img")
+                thumbnail_src = thumbnail_tag["src"] if thumbnail_tag else ""
+                if thumbnail_src.startswith("//"):
+                    thumbnail = "https:" + thumbnail_src
+                else:
+                    thumbnail = thumbnail_src
+                price_match = re.search(r"(\d{1,3}(?:,\d{3})*원)", full_title)
+                price = price_match.group(1) if price_match else "가격 정보 없음"
+                shipping = (
+                    "무료배송"
+                    if "무료" in full_title or "무배" in full_title
+                    else "배송비 정보 없음"
+                )
+                clean_title = clean_deal_title(full_title)
+                category = classify_category(clean_title)
+                deal_list.append(
+                    {
+                        "thumbnail": thumbnail,
+                        "source": "뽐뿌",
+                        "author": author_cell.text.strip(),
+                        "title": clean_title,
+                        "price": price,
+                        "shipping": shipping,
+                        "link": link,
+                        "category": category,
+                    }
+                )
+        except Exception as e:
+            logger.warning(f"뽐뿌 항목 파싱 오류: {e}")
+            continue
+
+    return deal_list
+
+
+def parse_ruliweb(html: str, parser: str = None) -> list:
+    """루리웹 목록 파싱 (썸네일은 상세 페이지 og:image 로 별도 수집)"""
+    soup = make_soup("루리웹", html, parser)
+    deal_list = []
+
+    for row in soup.select("table.board_list_table tbody tr.table_body"):
+        try:
+            if "notice" in row.get("class", []):
+                continue
+
+            title_tag = row.select_one("a.deco")
+            if not title_tag:
+                continue
+
+            full_title = title_tag.get_text(strip=True)
+            link = title_tag.get("href", "")
+            if link.startswith("/"):
+                link = "https://bbs.ruliweb.com" + link
+
+            author_tag = row.select_one("td.writer a")
+            author = author_tag.get_text(strip=True) if author_tag else "작성자"
+
+            price = parse_price_to_number(full_title)
+            clean_title = clean_deal_title(full_title)
+            category = classify_category(clean_title)
+
+            deal_list.append(
+                {
+                    "thumbnail": "",
+                    "source": "루리웹",
+                    "author": author,
+                    "title": clean_title,
+                    "price": price,
+                    "shipping": "정보 없음",
+                    "link": link,
+                    "category": category,
+                }
+            )
+        except Exception as e:
+            logger.warning(f"루리웹 항목 파싱 오류: {e}")
+            continue
+
+    return deal_list
+
+
+def parse_og_image(source: str, html: str, parser: str = None) -> str:
+    """상세 페이지에서 og:image 만 추출 (meta 태그만 파싱)"""
+    soup = make_soup(source, html, parser, parse_only=SoupStrainer("meta"))
+    og = soup.find("meta", property="og:image")
+    return og.get("content", "") if og else ""
+
+
+def parse_zod(html: str, parser: str = None) -> list:
+    soup = make_soup("Zod", html, parser)
+    deal_list = []
+
+    for item in soup.select("ul.app-board-template-list li"):
+        try:
+            text_content = item.get_text()
+            if not text_content or "공지" in text_content[:10]:
+                continue
+
+            link_tag = item.select_one('a[href*="/deal/"]')
+            if not link_tag:
+                continue
+            href = link_tag.get("href", "")
+            if not href or "/deal/" not in href:
+                continue
+            link = "https://zod.kr" + href if href.startswith("/") else href
+
+            img = item.select_one("img")
+            thumbnail = ""
+            if img:
+                src = img.get("src", "")
+                if src.startswith("//"):
+                    thumbnail = "https:" + src
+                elif src.startswith("http"):
+                    thumbnail = src
+
+            title_span = item.select_one("span.app-list-title-item")
+            title = title_span.get_text(strip=True) if title_span else "제목 없음"
+
+            price = "가격 정보 없음"
+            shipping = "정보 없음"
+            for dd in item.select("dl.zod-board--deal-meta dd"):
+                dd_text = dd.get_text(strip=True)
+                strong = dd.find("strong")
+                if not strong:
+                    continue
+                val = strong.get_text(strip=True)
+                if "가격:" in dd_text:
+                    price = val
+                elif "배송비:" in dd_text:
+                    shipping = "무료배송" if "무료" in val else val
+
+            member_div = item.select_one("dd.app-list-member")
+            author = "작성자"
+            if member_div:
+                for img in member_div.find_all("img"):
+                    img.decompose()
+                author = member_div.get_text(strip=True) or "작성자"
+
+            deal_list.append(
+                {
+                    "thumbnail": thumbnail,
+                    "source": "Zod",
+                    "author": author,
+                    "title": clean_deal_title(title),
+                    "price": price,
+                    "shipping": shipping,
+                    "link": link,
+                    "category": classify_category(title),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Zod 항목 파싱 오류: {e}")
+            continue
+
+    return deal_list
+
+
+def _quasarzone_shipping_text(cont) -> str:
+    # 메타 span 중 카테고리/가격/닉네임/조회수/날짜가 아닌 첫 번째 항목
+    for span in cont.select("div.market-info-sub span"):
+        if not QUASARZONE_META_CLASSES.intersection(span.get("class", [])):
+            return span.get_text(strip=True)
+    return ""
+
+
+def parse_quasarzone(html: str, parser: str = None) -> list:
+    soup = make_soup("퀘이사존", html, parser)
+    deal_list = []
+
+    posts = soup.find_all("div", class_="market-info-list")
+    logger.info(f"퀘이사존: {len(posts)}개 게시글 발견")
+
+    for idx, item in enumerate(posts):
+        try:
+            thumbnail = ""
+            thumb_wrap = item.find("div", class_="thumb-wrap")
+            if thumb_wrap:
+                img_tag = thumb_wrap.find("img", class_="maxImg")
+                if img_tag and img_tag.get("src"):
+                    thumbnail = _absolute_url(img_tag["src"], "https://quasarzone.com")
+
+            cont = item.find("div", class_="market-info-list-cont")
+            if not cont:
+                continue
+
+            tit = cont.find("p", class_="tit")
+            if not tit:
+                continue
+
+            link_tag = tit.find("a", class_="subject-link")
+            if not link_tag:
+                continue
+
+            title = link_tag.get_text(strip=True)
+            href = link_tag.get("href", "")
+
+            if href.startswith("/"):
+                link = "https://quasarzone.com" + href
+            elif href.startswith("http"):
+                link = href
+            else:
+                link = "https://quasarzone.com/" + href
+
+            author = "작성자"
+            nick_wrap = cont.find("span", class_="nick")
+            if nick_wrap:
+                author = nick_wrap.get_text(strip=True)
+
+            price = "가격 정보 없음"
+            price_el = cont.find("span", class_="text-orange")
+            if price_el:
+                raw = price_el.get_text(strip=True)
+                price_match = re.search(r"[\d,]+", raw)
+                if price_match:
+                    price = price_match.group(0) + "원"
+            else:
+                price_match = re.search(r"(\d{1,3}(?:,\d{3})*원)", title)
+                if price_match:
+                    price = price_match.group(1)
+
+            shipping_text = _quasarzone_shipping_text(cont)
+            if "무료" in title + shipping_text or "무배" in title + shipping_text:
+                shipping = "무료배송"
+            elif shipping_text and "배송" in shipping_text:
+                shipping = shipping_text
+            else:
+                shipping = "정보 없음"
+
+            deal_list.append(
+                {
+                    "thumbnail": thumbnail,
+                    "source": "퀘이사존",
+                    "author": author,
+                    "title": clean_deal_title(title),
+                    "price": price,
+                    "shipping": shipping,
+                    "link": link,
+                    "category": classify_category(title),
+                }
+            )
+
+            logger.debug(f"퀘이사존 항목 {idx + 1}: {title[:30]}...")
+
+        except Exception as e:
+            logger.warning(f"퀘이사존 항목 {idx + 1} 파싱 오류: {e}")
+            continue
+
+    return deal_list
+
+
+def parse_eomisae(html: str, parser: str = None) -> list:
+    soup = make_soup("어미새", html, parser)
+    deal_list = []
+
+    items = soup.select(".card_el")
+    if not items:
+        logger.warning("어미새: .card_el 셀렉터 결과 없음")
+        return []
+
+    for idx, item in enumerate(items):
+        try:
+            link_tag = item.find("a")
+            if not link_tag:
+                continue
+            link_href = link_tag.get("href", "")
+            if not link_href:
+                continue
+            if link_href.startswith("/"):
+                link = "https://eomisae.co.kr" + link_href
+            elif link_href.startswith("http"):
+                link = link_href
+            else:
+                continue
+
+            title_tag = item.find("h3") or item.find("h2")
+            title = title_tag.get_text(strip=True) if title_tag else ""
+            if not title or title == "list_adsense":
+                continue
+
+            img_tag = item.find("img")
+            thumbnail = ""
+            if img_tag:
+                thumbnail = _absolute_url(img_tag.get("src", ""), "https://eomisae.co.kr")
+
+            price = parse_price_to_number(title)
+            shipping = (
+                "무료배송" if "무료" in title or "무배" in title else "정보 없음"
+            )
+
+            deal_list.append(
+                {
+                    "thumbnail": thumbnail,
+                    "source": "어미새",
+                    "author": "작성자",
+                    "title": clean_deal_title(title),
+                    "price": price,
+                    "shipping": shipping,
+                    "link": link,
+                    "category": classify_category(title),
+                }
+            )
+
+        except Exception as e:
+            logger.warning(f"어미새 항목 {idx + 1} 파싱 오류: {e}")
+            continue
+
+    return deal_list
+
+
+# 소스별 목록 페이지 파서 (벤치마크/재생 도구에서 공용)
+PARSERS = {
+    "뽐뿌": parse_ppomppu,
+    "루리웹": parse_ruliweb,
+    "Zod": parse_zod,
+    "퀘이사존": parse_quasarzone,
+    "어미새": parse_eomisae,
+}
+
+
+def parse_compact(source: str, html: str) -> list:
+    """파싱 워커 프로세스용: 딜을 DEAL_FIELDS 순서의 튜플로 반환 (피클 크기 축소)"""
+    return [
+        tuple(deal[field] for field in DEAL_FIELDS) for deal in PARSERS[source](html)
+    ]
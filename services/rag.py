@@ -1,25 +1,45 @@
 import os
 import logging
+import threading
+import time
 from typing import Optional
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_chroma import Chroma
 
+from services.embedding_cache import CachedEmbeddings
+
 logger = logging.getLogger(__name__)
 
 CHROMA_DB_DIR = (
     "/data/chroma_db" if os.getenv("APP_ENV") == "production" else "./chroma_db"
 )
+EMBEDDING_MODEL = "models/text-embedding-004"
+RAG_UPSERT_BATCH = int(os.getenv("RAG_UPSERT_BATCH", 256))
 
+_vectorstore: Optional[Chroma] = None
+_vectorstore_lock = threading.Lock()
+_orphan_ids = set()
+_orphan_lock = threading.Lock()
+_orphan_stats = {"queued": 0, "purged": 0, "last_purge_at": None}
+_metrics = {
+    "init_ms": None,
+    "initialized_at": None,
+    "init_errors": 0,
+    "last_error": None,
+    "first_query_ms": None,
+    "queries": 0,
+    "last_query_ms": None,
+}
 
-def get_vectorstore() -> Optional[Chroma]:
-    """벡터 DB(기억장치) 가져오기"""
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-    if not GOOGLE_API_KEY:
-        return None
 
+def _open_vectorstore(google_api_key: str) -> Optional[Chroma]:
+    started = time.perf_counter()
     try:
-        embeddings = GoogleGenerativeAIEmbeddings(
-            model="models/text-embedding-004", google_api_key=GOOGLE_API_KEY
+        embeddings = CachedEmbeddings(
+            GoogleGenerativeAIEmbeddings(
+                model=EMBEDDING_MODEL, google_api_key=google_api_key
+            ),
+            model=EMBEDDING_MODEL,
         )
 
         vectorstore = Chroma(
@@ -27,21 +47,176 @@ def get_vectorstore() -> Optional[Chroma]:
             embedding_function=embeddings,
             collection_name="hotdeals",
         )
-        return vectorstore
     except Exception as e:
+        _metrics["init_errors"] += 1
+        _metrics["last_error"] = str(e)
         logger.error(f"VectorStore 초기화 실패: {e}")
         return None
 
+    _metrics["init_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    _metrics["initialized_at"] = time.time()
+    logger.info(f"🧠 VectorStore 초기화 완료 ({_metrics['init_ms']}ms)")
+    return vectorstore
 
-def upsert_rag_documents(vectorstore: Chroma, documents: list) -> None:
-    """RAG 문서 추가/갱신"""
-    if not documents:
+
+def get_vectorstore() -> Optional[Chroma]:
+    """벡터 DB(기억장치) 가져오기 (프로세스당 1회 초기화 후 재사용)"""
+    global _vectorstore
+    if _vectorstore is not None:
+        return _vectorstore
+
+    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+    if not GOOGLE_API_KEY:
+        return None
+
+    with _vectorstore_lock:
+        if _vectorstore is None:
+            _vectorstore = _open_vectorstore(GOOGLE_API_KEY)
+    return _vectorstore
+
+
+def init_vectorstore() -> bool:
+    """서버 시작 시 벡터 DB를 미리 연결 (첫 AI 검색 지연 방지)"""
+    return get_vectorstore() is not None
+
+
+def close_vectorstore() -> None:
+    """서버 종료 시 벡터 DB 연결 해제"""
+    global _vectorstore
+    with _vectorstore_lock:
+        vectorstore, _vectorstore = _vectorstore, None
+    if vectorstore is None:
         return
 
     try:
-        ids = [doc.metadata["rag_id"] for doc in documents]
-        vectorstore.delete(ids=ids)
-        vectorstore.add_documents(documents, ids=ids)
+        from chromadb.api.client import SharedSystemClient
+
+        system = getattr(vectorstore._client, "_system", None)
+        if system is not None:
+            system.stop()
+        SharedSystemClient.clear_system_cache()
+        logger.info("🛑 VectorStore 연결 종료")
+    except Exception as e:
+        logger.error(f"VectorStore 종료 오류: {e}")
+
+
+def record_query_latency(elapsed_ms: float) -> None:
+    """벡터 검색 지연시간 기록 (첫 쿼리는 별도 보관)"""
+    elapsed_ms = round(elapsed_ms, 1)
+    if _metrics["first_query_ms"] is None:
+        _metrics["first_query_ms"] = elapsed_ms
+    _metrics["queries"] += 1
+    _metrics["last_query_ms"] = elapsed_ms
+
+
+def queue_orphan_vectors(rag_ids) -> None:
+    """DB에 없는 딜의 벡터 id를 삭제 대기열에 추가"""
+    with _orphan_lock:
+        before = len(_orphan_ids)
+        _orphan_ids.update(rag_ids)
+        _orphan_stats["queued"] += len(_orphan_ids) - before
+
+
+def purge_orphan_vectors() -> int:
+    """삭제 대기열의 orphan 벡터를 벡터 DB에서 제거"""
+    vectorstore = _vectorstore
+    with _orphan_lock:
+        if vectorstore is None or not _orphan_ids:
+            return 0
+        rag_ids = list(_orphan_ids)
+        _orphan_ids.clear()
+
+    try:
+        vectorstore.delete(ids=rag_ids)
+    except Exception as e:
+        queue_orphan_vectors(rag_ids)
+        logger.error(f"🧠 orphan 벡터 삭제 실패: {e}")
+        return 0
+
+    _orphan_stats["purged"] += len(rag_ids)
+    _orphan_stats["last_purge_at"] = time.time()
+    logger.info(f"🧠 orphan 벡터 {len(rag_ids)}개 삭제")
+    return len(rag_ids)
+
+
+def vectorstore_health() -> dict:
+    """초기화된 벡터 DB 상태 (새로 열지 않음)"""
+    vectorstore = _vectorstore
+    health = {
+        "initialized": vectorstore is not None,
+        **_metrics,
+        "orphans": {**_orphan_stats, "pending": len(_orphan_ids)},
+    }
+    if vectorstore is None:
+        health["status"] = "not_initialized"
+        return health
+
+    try:
+        health["documents"] = vectorstore._collection.count()
+        health["embedding_cache"] = vectorstore.embeddings.stats()
+        health["status"] = "ok"
+    except Exception as e:
+        health["status"] = "error"
+        health["error"] = str(e)
+    return health
+
+
+def _metadata_matches(stored: Optional[dict], metadata: dict) -> bool:
+    stored = stored or {}
+    return all(stored.get(key) == value for key, value in metadata.items())
+
+
+def upsert_rag_documents(vectorstore: Chroma, documents: list) -> dict:
+    """RAG 문서 추가/갱신 (바뀐 문서만 청크 단위 upsert, 삭제 구간 없음)"""
+    counts = {"added": 0, "updated": 0, "unchanged": 0}
+    if not documents:
+        return counts
+
+    # 같은 rag_id가 여러 번 오면 마지막 문서 기준
+    documents = list({doc.metadata["rag_id"]: doc for doc in documents}.values())
+    collection = vectorstore._collection
+    batch_size = min(RAG_UPSERT_BATCH, vectorstore._client.get_max_batch_size())
+
+    try:
+        for i in range(0, len(documents), batch_size):
+            chunk = documents[i : i + batch_size]
+            ids = [doc.metadata["rag_id"] for doc in chunk]
+            stored = collection.get(ids=ids, include=["documents", "metadatas"])
+            stored_map = {
+                rag_id: (text, metadata)
+                for rag_id, text, metadata in zip(
+                    stored["ids"], stored["documents"], stored["metadatas"]
+                )
+            }
+
+            changed = []
+            for doc in chunk:
+                previous = stored_map.get(doc.metadata["rag_id"])
+                if previous is None:
+                    counts["added"] += 1
+                elif previous[0] != doc.page_content or not _metadata_matches(
+                    previous[1], doc.metadata
+                ):
+                    counts["updated"] += 1
+                else:
+                    counts["unchanged"] += 1
+                    continue
+                changed.append(doc)
+
+            if not changed:
+                continue
+
+            texts = [doc.page_content for doc in changed]
+            # 임베딩 캐시를 거쳐 미리 계산한 벡터로 저장 (처음 보는 문장만 API 호출)
+            vectors = vectorstore.embeddings.embed_documents(texts)
+            collection.upsert(
+                ids=[doc.metadata["rag_id"] for doc in changed],
+                embeddings=vectors,
+                documents=texts,
+                metadatas=[doc.metadata for doc in changed],
+            )
     except Exception as e:
         logger.error(f"RAG 문서 저장 실패: {e}")
         raise
+
+    return counts
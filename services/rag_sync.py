@@ -0,0 +1,206 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import time
+from typing import Optional
+
+from models import HotDeal
+from services.db_executor import run_db
+from services.rag import CHROMA_DB_DIR, get_vectorstore, upsert_rag_documents
+
+logger = logging.getLogger(__name__)
+
+RAG_SYNC_CHUNK_SIZE = int(os.getenv("RAG_SYNC_CHUNK_SIZE", 500))
+RAG_SYNC_CONCURRENCY = int(os.getenv("RAG_SYNC_CONCURRENCY", 2))
+RAG_SYNC_CHECKPOINT = os.path.join(CHROMA_DB_DIR, "rag_sync_checkpoint.json")
+
+
+def load_deal_chunk(db, after_id: int, limit: int) -> list:
+    """id > after_id 인 딜을 id 순으로 limit개 (짧은 읽기 트랜잭션)"""
+    from services.database import make_rag_document
+
+    deals = (
+        db.query(HotDeal.id, HotDeal.source, HotDeal.title, HotDeal.price, HotDeal.link)
+        .filter(HotDeal.id > after_id)
+        .order_by(HotDeal.id)
+        .limit(limit)
+        .all()
+    )
+    return [(deal.id, make_rag_document(deal._asdict())) for deal in deals]
+
+
+def read_checkpoint() -> dict:
+    try:
+        with open(RAG_SYNC_CHECKPOINT, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_checkpoint(checkpoint: dict) -> None:
+    os.makedirs(os.path.dirname(RAG_SYNC_CHECKPOINT) or ".", exist_ok=True)
+    tmp_path = f"{RAG_SYNC_CHECKPOINT}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, RAG_SYNC_CHECKPOINT)
+
+
+class RagSyncJob:
+    """전체 RAG 재동기화 작업 (id 청크 단위 스트리밍, 체크포인트로 이어서 실행)"""
+
+    def __init__(self, start_after_id: int = 0):
+        self.job_id = secrets.token_hex(6)
+        self.status = "running"
+        self.started_at = time.time()
+        self.finished_at = None
+        self.resumed_from = start_after_id
+        self.last_id = start_after_id
+        self.total = None
+        self.processed = 0
+        self.counts = {"added": 0, "updated": 0, "unchanged": 0}
+        self.error = None
+        self._pending = []
+        self._done = set()
+        self._failure = None
+
+    async def run(self) -> None:
+        try:
+            vectorstore = await asyncio.to_thread(get_vectorstore)
+            if vectorstore is None:
+                raise RuntimeError("VectorStore 초기화 실패")
+
+            self.total = await run_db(
+                lambda db: db.query(HotDeal).filter(HotDeal.id > self.last_id).count()
+            )
+            semaphore = asyncio.Semaphore(RAG_SYNC_CONCURRENCY)
+            tasks = []
+            after_id = self.last_id
+
+            while True:
+                await semaphore.acquire()
+                # 실패한 청크가 있으면 새 청크를 읽지 않고 중단
+                if self._failure is not None:
+                    semaphore.release()
+                    break
+                try:
+                    chunk = await run_db(load_deal_chunk, after_id, RAG_SYNC_CHUNK_SIZE)
+                except BaseException:
+                    semaphore.release()
+                    raise
+                if not chunk:
+                    semaphore.release()
+                    break
+
+                after_id = chunk[-1][0]
+                self._pending.append(after_id)
+                task = asyncio.create_task(
+                    self._sync_chunk(vectorstore, chunk, after_id, semaphore)
+                )
+                tasks.append(task)
+
+            # 진행 중인 청크까지 모두 끝난 뒤 실패 여부 확인
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._failure is not None:
+                raise self._failure
+
+            self.status = "completed"
+            write_checkpoint(
+                {"job_id": self.job_id, "last_id": self.last_id, "completed": True}
+            )
+            logger.info(
+                f"🧠 RAG 전체 동기화 완료 ({self.job_id}): {self.processed}개, "
+                f"추가 {self.counts['added']}, 갱신 {self.counts['updated']}, 변경없음 {self.counts['unchanged']}"
+            )
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            # 끊김 없이 끝난 마지막 청크 지점부터 이어서 실행
+            try:
+                write_checkpoint(
+                    {"job_id": self.job_id, "last_id": self.last_id, "completed": False}
+                )
+            except OSError as checkpoint_error:
+                logger.error(f"RAG 동기화 체크포인트 저장 실패: {checkpoint_error}")
+            logger.error(f"❌ RAG 전체 동기화 실패 ({self.job_id}, last_id={self.last_id}): {e}")
+        finally:
+            self.finished_at = time.time()
+
+    async def _sync_chunk(self, vectorstore, chunk, chunk_last_id, semaphore) -> None:
+        try:
+            documents = [document for _, document in chunk]
+            counts = await asyncio.to_thread(
+                upsert_rag_documents, vectorstore, documents
+            )
+        except Exception as e:
+            if self._failure is None:
+                self._failure = e
+            return
+        finally:
+            semaphore.release()
+
+        for key, value in counts.items():
+            self.counts[key] += value
+        self.processed += len(chunk)
+        self._advance_checkpoint(chunk_last_id)
+
+    def _advance_checkpoint(self, chunk_last_id: int) -> None:
+        """앞선 청크가 모두 끝난 지점까지만 체크포인트 전진 (병렬 완료 순서 보정)"""
+        self._done.add(chunk_last_id)
+        advanced = False
+        while self._pending and self._pending[0] in self._done:
+            self.last_id = self._pending.pop(0)
+            self._done.discard(self.last_id)
+            advanced = True
+        if advanced:
+            write_checkpoint(
+                {"job_id": self.job_id, "last_id": self.last_id, "completed": False}
+            )
+
+    def to_dict(self) -> dict:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(elapsed, 1),
+            "resumed_from": self.resumed_from,
+            "last_id": self.last_id,
+            "processed": self.processed,
+            "total": self.total,
+            "progress": round(self.processed / self.total, 3) if self.total else None,
+            "docs_per_second": round(self.processed / elapsed, 1) if elapsed else None,
+            **self.counts,
+            "error": self.error,
+        }
+
+
+_current_job: Optional[RagSyncJob] = None
+_current_task: Optional[asyncio.Task] = None
+
+
+def start_rag_sync(resume: bool = True) -> RagSyncJob:
+    """백그라운드 RAG 동기화 시작 (실행 중이면 기존 작업 반환)"""
+    global _current_job, _current_task
+    if _current_job is not None and _current_job.status == "running":
+        return _current_job
+
+    checkpoint = read_checkpoint()
+    start_after_id = 0
+    if resume and checkpoint and not checkpoint.get("completed"):
+        start_after_id = int(checkpoint.get("last_id", 0))
+
+    _current_job = RagSyncJob(start_after_id)
+    _current_task = asyncio.create_task(_current_job.run())
+    logger.info(
+        f"🧠 RAG 전체 동기화 시작 ({_current_job.job_id}, id > {start_after_id})"
+    )
+    return _current_job
+
+
+def rag_sync_status() -> dict:
+    if _current_job is None:
+        return {"status": "idle", "checkpoint": read_checkpoint()}
+    return {**_current_job.to_dict(), "checkpoint": read_checkpoint()}
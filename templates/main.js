@@ -10,6 +10,7 @@ const state = {
     searchMode: false,
     currentQuery: "",
     currentDeals: [],
+    aiSource: null,
 };
 
 function sanitizeExternalUrl(value) {
@@ -339,6 +340,7 @@ async function loadDashboardStats() {
 
 async function fetchDeals(source = "all", page = 1, append = false) {
     if (state.loading) return;
+    if (!append) hideAiAnswer();
     state.loading = true;
     state.source = source;
     state.page = page;
@@ -393,6 +395,7 @@ async function performSearch() {
         return;
     }
 
+    hideAiAnswer();
     state.loading = true;
     state.searchMode = true;
     state.currentQuery = query;
@@ -436,6 +439,82 @@ async function performSearch() {
     }
 }
 
+function closeAiStream() {
+    if (state.aiSource) {
+        state.aiSource.close();
+        state.aiSource = null;
+    }
+}
+
+function hideAiAnswer() {
+    closeAiStream();
+    const panel = getElement("aiAnswerPanel");
+    if (panel) panel.classList.add("hidden");
+}
+
+function performAiSearch() {
+    const input = getElement("searchInput");
+    const panel = getElement("aiAnswerPanel");
+    const answerText = getElement("aiAnswerText");
+    const answerMeta = getElement("aiAnswerMeta");
+    if (!input || !panel || !answerText || !answerMeta) return;
+
+    const query = input.value.trim();
+    if (!query) {
+        showToast("검색어를 입력해주세요.", "info");
+        return;
+    }
+
+    closeAiStream();
+    state.loading = true;
+    state.searchMode = true;
+    state.currentQuery = query;
+    renderLoadingState();
+    renderPagination(null);
+    panel.classList.remove("hidden");
+    answerText.textContent = "";
+    answerMeta.textContent = "관련 딜을 찾는 중...";
+
+    const startedAt = performance.now();
+    const source = new EventSource(`/api/search/ai/stream?${new URLSearchParams({ query }).toString()}`);
+    state.aiSource = source;
+
+    source.addEventListener("deals", (event) => {
+        const data = JSON.parse(event.data);
+        const deals = data.deals || [];
+        state.currentDeals = deals.slice();
+        if (deals.length === 0) renderEmptyState(`"${query}" 관련 딜이 없습니다.`);
+        else renderDeals(deals, false);
+        updateSummary(deals, null, "search");
+        answerMeta.textContent = `딜 ${deals.length}건 · ${Math.round(performance.now() - startedAt)}ms · 답변 작성 중...`;
+        state.loading = false;
+    });
+
+    source.addEventListener("token", (event) => {
+        answerText.textContent += JSON.parse(event.data).text;
+    });
+
+    source.addEventListener("done", (event) => {
+        const data = JSON.parse(event.data);
+        const timings = data.timings || {};
+        const firstContent = timings.first_content_ms ?? Math.round(performance.now() - startedAt);
+        answerMeta.textContent = data.cache === "miss"
+            ? `첫 결과 ${Math.round(firstContent)}ms · 전체 ${Math.round(timings.total_ms || 0)}ms`
+            : "캐시된 답변";
+        closeAiStream();
+    });
+
+    source.addEventListener("error", (event) => {
+        // 서버가 보낸 error 이벤트는 data가 있고, 연결 오류는 data가 없음
+        const message = event.data ? JSON.parse(event.data).message : "AI 검색 연결이 끊어졌습니다.";
+        closeAiStream();
+        state.loading = false;
+        answerMeta.textContent = "";
+        if (!answerText.textContent) answerText.textContent = message;
+        showToast(message, "error");
+    });
+}
+
 function toggleMobilePanel(force) {
     const panel = getElement("mobileQuickPanel");
     const backdrop = getElement("mobileQuickBackdrop");
@@ -510,6 +589,7 @@ function resetFilters() {
 }
 
 window.performSearch = performSearch;
+window.performAiSearch = performAiSearch;
 window.toggleMobilePanel = toggleMobilePanel;
 window.toggleProfileMenu = toggleProfileMenu;
 window.toggleFilters = toggleFilters;
@@ -0,0 +1,51 @@
+import asyncio
+
+from services.cache import TTLCache
+
+
+def test_get_or_load_survives_first_caller_cancel():
+    async def scenario():
+        cache = TTLCache("test")
+        started = asyncio.Event()
+
+        async def loader():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_load("key", loader))
+        await started.wait()
+        second = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1] == "value"
+        assert cache.get("key") == "value"
+        assert cache.stats()["coalesced"] == 1
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_get_or_load_shares_loader_error():
+    async def scenario():
+        cache = TTLCache("test")
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_load("key", loader),
+            cache.get_or_load("key", loader),
+            return_exceptions=True,
+        )
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert len(calls) == 1
+        assert cache.get("key") is None
+
+    asyncio.run(scenario())